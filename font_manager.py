@@ -14,6 +14,10 @@ from reportlab.pdfbase import pdfmetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+# In-memory cache of font names that could not be registered, so the system
+# font search and the download are not retried for every text in the same run
+_FAILED_FONT_REGISTRATIONS = set()
+
 # Google Fonts with good Arabic support (Open Source)
 ARABIC_FONTS = {
     "Amiri": {
@@ -377,6 +381,11 @@ def _register_font(
     :param font_type: Type of font for logging
     :return: Registered font name or None if failed
     """
+    # Don't search and download again after a failure in this process. Checked
+    # first, because getFont on an unknown name scans the system for AFM files
+    if font_name in _FAILED_FONT_REGISTRATIONS and not force_download:
+        return None
+
     # Check if already registered
     try:
         pdfmetrics.getFont(font_name)
@@ -425,9 +434,11 @@ def _register_font(
             return font_name
         except Exception as e:
             _LOGGER.error(f"Failed to register font: {e}")
+            _FAILED_FONT_REGISTRATIONS.add(font_name)
             return None
 
     _LOGGER.error(f"Failed to find or download a {font_type}-supporting font")
+    _FAILED_FONT_REGISTRATIONS.add(font_name)
     return None
 
 
@@ -439,17 +450,19 @@ def get_arabic_font():
     :return: Font name suitable for Arabic text
     """
     # Try to register Arabic font
+    already_failed = "ArabicFont" in _FAILED_FONT_REGISTRATIONS
     font_name = register_arabic_font("ArabicFont")
 
     if font_name:
         return font_name
 
     # Fallback to Helvetica (won't render Arabic correctly but won't crash)
-    _LOGGER.warning(
-        "Could not register Arabic font. Using Helvetica as fallback. "
-        "Arabic text will appear as boxes. "
-        "Install arabic-reshaper and python-bidi: pip install arabic-reshaper python-bidi"
-    )
+    if not already_failed:
+        _LOGGER.warning(
+            "Could not register Arabic font. Using Helvetica as fallback. "
+            "Arabic text will appear as boxes. "
+            "Install arabic-reshaper and python-bidi: pip install arabic-reshaper python-bidi"
+        )
     return "Helvetica"
 
 
@@ -461,16 +474,18 @@ def get_cjk_font():
     :return: Font name suitable for CJK text
     """
     # Try to register CJK font
+    already_failed = "CJKFont" in _FAILED_FONT_REGISTRATIONS
     font_name = register_cjk_font("CJKFont")
 
     if font_name:
         return font_name
 
     # Fallback to Helvetica (won't render CJK correctly but won't crash)
-    _LOGGER.warning(
-        "Could not register CJK font. Using Helvetica as fallback. "
-        "Chinese/Japanese/Korean text will appear as boxes."
-    )
+    if not already_failed:
+        _LOGGER.warning(
+            "Could not register CJK font. Using Helvetica as fallback. "
+            "Chinese/Japanese/Korean text will appear as boxes."
+        )
     return "Helvetica"
 
 
@@ -17,6 +17,7 @@ import logging
 from text_rendering import (
     set_emoji_cache_dir,
     precache_emojis_in_text,
+    prewarm_emoji_cache,
     contains_arabic,
     contains_cjk,
     get_font_for_text,
@@ -402,41 +403,39 @@ def _draw_debug_lines(
     top_margin = margin
     bottom_margin = margin
 
-    canvas_obj.setStrokeColorRGB(1, 0, 0)
     canvas_obj.setLineWidth(0.5)
 
-    # Draw margin boundaries
-    canvas_obj.rect(margin, margin, width - 2 * margin, height - 2 * margin)
-
-    # Draw text area boundary
-    canvas_obj.rect(margin, bottom_margin, max_width, available_height)
-
-    # Draw max width line
-    canvas_obj.line(margin + max_width, margin, margin + max_width, height - margin)
-
     # Draw divider line (blue)
     canvas_obj.setStrokeColorRGB(0, 0, 1)
     canvas_obj.line(divider_x, margin, divider_x, height - margin)
-    canvas_obj.setStrokeColorRGB(1, 0, 0)
-
-    # Draw height margin line
-    canvas_obj.line(margin, height - top_margin, divider_x, height - top_margin)
 
-    # Labels
-    canvas_obj.setFont(font_name, 6)
-    canvas_obj.setFillColorRGB(1, 0, 0)
-    canvas_obj.drawString(margin + 2, height - margin - 8, f"Margin: {margin/mm:.1f}mm")
-    canvas_obj.drawString(
-        margin + max_width + 2, height - margin - 8, f"MaxWidth: {max_width/mm:.1f}mm"
-    )
-    canvas_obj.drawString(
-        margin + 2, height - top_margin + 2, f"TopMargin: {top_margin/mm:.1f}mm"
-    )
-    canvas_obj.drawString(margin + 2, margin + 2, f"FontSize: {font_size}pt")
-    canvas_obj.drawString(margin + 2, margin + 12, f"LineHeight: {line_height:.1f}pt")
-    canvas_obj.drawString(
-        divider_x + 2, height - margin - 8, f"DividerX: {divider_x/mm:.1f}mm"
-    )
+    # Draw all red boundaries under a single stroke color
+    canvas_obj.setStrokeColorRGB(1, 0, 0)
+    # Margin boundaries and text area boundary
+    canvas_obj.rect(margin, margin, width - 2 * margin, height - 2 * margin)
+    canvas_obj.rect(margin, bottom_margin, max_width, available_height)
+    # Max width line and height margin line
+    canvas_obj.lines([
+        (margin + max_width, margin, margin + max_width, height - margin),
+        (margin, height - top_margin, divider_x, height - top_margin),
+    ])
+
+    # Labels, batched into a single text object
+    labels = [
+        (margin + 2, height - margin - 8, f"Margin: {margin/mm:.1f}mm"),
+        (margin + max_width + 2, height - margin - 8, f"MaxWidth: {max_width/mm:.1f}mm"),
+        (margin + 2, height - top_margin + 2, f"TopMargin: {top_margin/mm:.1f}mm"),
+        (margin + 2, margin + 2, f"FontSize: {font_size}pt"),
+        (margin + 2, margin + 12, f"LineHeight: {line_height:.1f}pt"),
+        (divider_x + 2, height - margin - 8, f"DividerX: {divider_x/mm:.1f}mm"),
+    ]
+    text_obj = canvas_obj.beginText()
+    text_obj.setFont(font_name, 6)
+    text_obj.setFillColorRGB(1, 0, 0)
+    for x, y, label in labels:
+        text_obj.setTextOrigin(x, y)
+        text_obj.textOut(label)
+    canvas_obj.drawText(text_obj)
 
     # Reset colors
     canvas_obj.setStrokeColorRGB(0, 0, 0)
@@ -497,11 +496,6 @@ def generate_back_side(
 
     # === PARAGRAPH MODE (for emoji, Arabic, and/or CJK text) ===
     if needs_paragraph:
-        # Pre-cache all emoji images for performance
-        if enable_emoji:
-            _LOGGER.debug("Pre-caching emoji images for message")
-            precache_emojis_in_text(message)
-
         # Create base paragraph style with appropriate alignment
         # Use right alignment for Arabic text
         alignment = TA_RIGHT if contains_arabic(message) else TA_LEFT
@@ -534,10 +528,19 @@ def generate_back_side(
                 text_color=text_color,
             )
             print(f"[PARAGRAPH MODE] Font size: {font_size}pt, fits: {text_fits}")
+            if para is not None:
+                # The search already built a drawable paragraph (emojis resolved),
+                # keep the outer style in sync so no rebuild is needed below
+                style.fontSize = font_size
+                style.leading = para.style.leading
         else:
             # Skip optimization, use minimum font size
             font_size = MIN_FONT_SIZE
             para = None
+            # Pre-cache all emoji images, the binary search did not resolve them
+            if enable_emoji:
+                _LOGGER.debug("Pre-caching emoji images for message")
+                precache_emojis_in_text(message)
             print(f"[PARAGRAPH MODE] Using minimum font size: {font_size}pt")
 
         # Handle truncation if text doesn't fit
@@ -588,12 +591,10 @@ def generate_back_side(
         
         if h > available_height:
             print(f"[PARAGRAPH MODE] Text exceeds height: {h:.0f}pt > {available_height:.0f}pt, reducing leading...")
-            # Reduce leading by 5% to fit
-            style.leading = style.leading * 0.95
-            processed_message = prepare_text_with_language_fonts(
-                message, enable_emoji, font_size, text_color
-            )
-            para = Paragraph(processed_message, style)
+            # Reduce leading by 5% to fit, reusing the already prepared markup
+            style.fontSize = font_size
+            style.leading = para.style.leading * 0.95
+            para = Paragraph(para.text, style)
             w, h = para.wrap(max_width, available_height)
             
             if h > available_height:
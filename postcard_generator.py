@@ -4,23 +4,88 @@ from reportlab.lib.units import mm
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfbase import pdfmetrics
+from reportlab import rl_config
 from PIL import Image
 import os
+import shutil
+import subprocess
 import tempfile
+import time
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    RectangleObject,
+)
 from typing import List, Union, Literal, Optional
 import io
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 
+# Resolution used for processed front images (rotated/cropped/converted).
+# Higher resolution source pixels are discarded during decode or resize.
+FRONT_IMAGE_DPI = 300
+
+# Write PDF streams (front image, fonts, page content) binary instead of ASCII85
+# encoded, which would inflate them by a quarter
+rl_config.useA85 = 0
+
+# Whether Pillow runs the extra Huffman table optimization pass when encoding
+# processed front images: about 6% smaller files for roughly 2.5x the encode time.
+# Processed images are cached, so the pass runs once per image, not per card.
+# (pillow-simd is a drop-in replacement that speeds up resize and encode further.)
+OPTIMIZE_FRONT_JPEG = True
+
+# Optional mozjpeg encoder, used for processed front images when installed
+CJPEG_EXECUTABLE = shutil.which("cjpeg")
+
+# Optional jpegtran, used to rotate JPEG front images losslessly when installed
+JPEGTRAN_EXECUTABLE = shutil.which("jpegtran")
+
+# Optional libjpeg-turbo bindings, used for scaled decoding of JPEG front images
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _TURBOJPEG = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # Module or the libturbojpeg shared library not installed
+    _TURBOJPEG = None
+
+# Batch back sides are rendered in chunks of at least this many cards per worker
+# process; smaller batches are not worth the process start-up cost
+MIN_BACK_SIDES_PER_WORKER = 20
+
+# Upper bound of back sides per chunk, so only one chunk's canvas and parsed PDF
+# are held in memory next to the output writer
+MAX_BACK_SIDES_PER_CHUNK = 500
+
+# In-memory cache of processed front images (JPEG data), so a front image that
+# is drawn again is not decoded and re-encoded again
+_FRONT_JPEG_CACHE = {}
+_FRONT_JPEG_CACHE_MAXSIZE = 8
+
+# In-memory cache of font paths that were already registered with ReportLab,
+# so the TTF file is only parsed once per process
+_REGISTERED_FONTS = {}
+
+# In-memory cache of font files that were not found, so the warning is only
+# printed once per process instead of for every canvas
+_MISSING_FONTS = set()
+
+# Front side of a splitted batch, parsed once per worker process by _init_batch_worker
+_BATCH_FRONT_READER = None
+
 
 # Try relative import first (when used as module), fall back to direct import (when run standalone)
 try:
-    from .postcard_generate_text_side import generate_back_side, set_emoji_cache_dir
+    from .postcard_generate_text_side import generate_back_side, set_emoji_cache_dir, prewarm_emoji_cache
     from .postprocessor import format_pdf_for_postcard
     from .QRCode.qr_code_postprocessor import qr_code_postprocessor
     from . import postcardformats
 except ImportError:
-    from postcard_generate_text_side import generate_back_side, set_emoji_cache_dir
+    from postcard_generate_text_side import generate_back_side, set_emoji_cache_dir, prewarm_emoji_cache
     from postprocessor import format_pdf_for_postcard
     from QRCode.qr_code_postprocessor import qr_code_postprocessor
     import postcardformats
@@ -33,19 +98,28 @@ def register_font(font_path):
     :param font_path: Path to TTF/OTF font file or name of built-in font
     :return: Font name string
     """
+    # Check in-memory cache first (fastest)
+    if font_path in _REGISTERED_FONTS:
+        return _REGISTERED_FONTS[font_path]
+
     if font_path.endswith((".ttf", ".otf")):
         try:
             # Check if font file exists
             if not os.path.exists(font_path):
-                print(f"WARNING: Font file not found: {font_path}")
-                print("Available built-in fonts: Helvetica, Times-Roman, Courier")
+                if font_path not in _MISSING_FONTS:
+                    _MISSING_FONTS.add(font_path)
+                    print(f"WARNING: Font file not found: {font_path}")
+                    print("Available built-in fonts: Helvetica, Times-Roman, Courier")
                 font_name = "Helvetica"  # Fallback to built-in font
             else:
                 # Derive font name from filename (without extension)
                 font_base_name = os.path.splitext(os.path.basename(font_path))[0]
-                pdfmetrics.registerFont(TTFont(font_base_name, font_path))
+                if font_base_name not in pdfmetrics.getRegisteredFontNames():
+                    pdfmetrics.registerFont(TTFont(font_base_name, font_path))
+                    print(f"Successfully loaded font: {font_path} as '{font_base_name}'")
                 font_name = font_base_name
-                print(f"Successfully loaded font: {font_path} as '{font_name}'")
+                # Only remember successful registrations, missing files are retried
+                _REGISTERED_FONTS[font_path] = font_name
         except Exception as e:
             print(f"ERROR loading font {font_path}: {e}")
             print("Falling back to Helvetica")
@@ -97,28 +171,311 @@ def enrich_warnings_with_card_info(warnings: dict, card_number: int, page_offset
     return enriched
 
 
-def _draw_image_on_canvas(
-    c,
+def _add_page_with_overlay(pdf_writer, page, overlay_page, shared_objects=None):
+    """
+    Internal helper: Add a copy of a page to a PdfWriter with another page drawn on top.
+
+    merge_page parses and rewrites the content streams of both pages for every copy.
+    Here the overlay is embedded as a Form XObject instead and drawn after the
+    untouched content of the page, so neither content stream is parsed and the
+    content and resources of the page stay shared between all copies in the writer.
+
+    :param pdf_writer: PdfWriter to add the page to
+    :param page: pypdf PageObject to copy, left unchanged
+    :param overlay_page: pypdf PageObject drawn on top, with the same page size
+    :param shared_objects: Optional dict kept by the caller across calls with the same
+        PdfWriter, so the small wrapper content streams, and the Form XObject of an
+        overlay page that is passed again, are stored only once
+    :return: The added PageObject
+    """
+    if shared_objects is None:
+        shared_objects = {}
+    added_page = pdf_writer.add_page(page)
+
+    # Keyed by id(), the page itself is kept in the value so the id is not reused
+    overlay_key = ("overlay", id(overlay_page))
+    if overlay_key not in shared_objects:
+        overlay_form = DecodedStreamObject()
+        overlay_form.set_data(overlay_page.get_contents().get_data())
+        overlay_form.update(
+            {
+                NameObject("/Type"): NameObject("/XObject"),
+                NameObject("/Subtype"): NameObject("/Form"),
+                NameObject("/BBox"): RectangleObject(overlay_page.mediabox),
+                NameObject("/Resources"): overlay_page["/Resources"].clone(pdf_writer),
+            }
+        )
+        shared_objects[overlay_key] = (
+            overlay_page,
+            pdf_writer._add_object(overlay_form.flate_encode()),
+        )
+    overlay_ref = shared_objects[overlay_key][1]
+
+    # New resource dicts that reference the shared resources of the page plus the overlay
+    resources = DictionaryObject(added_page.get("/Resources", DictionaryObject()).get_object())
+    xobjects = DictionaryObject(resources.get("/XObject", DictionaryObject()).get_object())
+    overlay_name = "/PostcardOverlay"
+    while overlay_name in xobjects:
+        overlay_name += "_"
+    xobjects[NameObject(overlay_name)] = overlay_ref
+    resources[NameObject("/XObject")] = xobjects
+    added_page[NameObject("/Resources")] = resources
+
+    # Isolate the graphics state of the page content, then draw the overlay
+    contents = added_page.get("/Contents")
+    if contents is None:
+        contents = ArrayObject()
+    elif isinstance(contents.get_object(), ArrayObject):
+        contents = ArrayObject(contents.get_object())
+    else:
+        contents = ArrayObject([contents])
+    wrapper_refs = []
+    for wrapper_data in (b"q\n", f"\nQ\nq {overlay_name} Do Q\n".encode()):
+        if wrapper_data not in shared_objects:
+            wrapper_stream = DecodedStreamObject()
+            wrapper_stream.set_data(wrapper_data)
+            shared_objects[wrapper_data] = pdf_writer._add_object(wrapper_stream)
+        wrapper_refs.append(shared_objects[wrapper_data])
+    added_page[NameObject("/Contents")] = ArrayObject(
+        [wrapper_refs[0], *contents, wrapper_refs[1]]
+    )
+    return added_page
+
+
+def _encode_jpeg(img, quality):
+    """
+    Internal helper: Encode an RGB image as JPEG bytes.
+
+    Uses mozjpeg's cjpeg (trellis quantization, progressive) when it is installed,
+    which typically produces 10-25% smaller files than Pillow at the same quality.
+    Falls back to Pillow if cjpeg is missing or fails.
+
+    :param img: PIL Image in RGB mode
+    :param quality: JPEG quality (1-100)
+    :return: JPEG data as bytes
+    """
+    if CJPEG_EXECUTABLE:
+        ppm_buffer = io.BytesIO()
+        img.save(ppm_buffer, "PPM")
+        try:
+            result = subprocess.run(
+                [CJPEG_EXECUTABLE, "-quality", str(quality), "-optimize", "-progressive"],
+                input=ppm_buffer.getvalue(),
+                capture_output=True,
+                check=True,
+            )
+            if result.stdout:
+                return result.stdout
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"WARNING: cjpeg failed ({e}), falling back to Pillow JPEG encoder")
+
+    jpeg_buffer = io.BytesIO()
+    img.save(jpeg_buffer, "JPEG", quality=quality, optimize=OPTIMIZE_FRONT_JPEG)
+    return jpeg_buffer.getvalue()
+
+
+def _rotate_jpeg_lossless(image_path):
+    """
+    Internal helper: Rotate a JPEG file 90 degrees counter-clockwise without re-encoding.
+
+    Uses jpegtran, which transforms the compressed DCT blocks directly. Partial
+    edge blocks that cannot be rotated losslessly are trimmed (a few pixels at most).
+
+    :param image_path: Path to the JPEG file
+    :return: Rotated JPEG data as bytes, or None if jpegtran is unavailable or fails
+    """
+    if not JPEGTRAN_EXECUTABLE:
+        return None
+    try:
+        result = subprocess.run(
+            [JPEGTRAN_EXECUTABLE, "-rotate", "270", "-trim", "-copy", "none", image_path],
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"WARNING: jpegtran failed ({e}), rotating with Pillow instead")
+        return None
+    return result.stdout or None
+
+
+def _crop_jpeg_lossless(image_path, crop_box):
+    """
+    Internal helper: Crop a JPEG file without re-encoding.
+
+    Uses jpegtran, which copies the compressed DCT blocks of the region directly.
+    The left and top edges move out to the nearest block boundary, so the result
+    can be up to 15 pixels wider and taller than requested.
+
+    :param image_path: Path to the JPEG file
+    :param crop_box: Crop box as (left, top, right, bottom) in pixels
+    :return: Cropped JPEG data as bytes, or None if jpegtran is unavailable or fails
+    """
+    if not JPEGTRAN_EXECUTABLE:
+        return None
+    left, top, right, bottom = crop_box
+    try:
+        result = subprocess.run(
+            [
+                JPEGTRAN_EXECUTABLE,
+                "-crop", f"{right - left}x{bottom - top}+{left}+{top}",
+                "-copy", "none",
+                image_path,
+            ],
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"WARNING: jpegtran failed ({e}), cropping with Pillow instead")
+        return None
+    return result.stdout or None
+
+
+def _jpeg_lossless_crop_box(img, crop_box):
+    """
+    Internal helper: Box a lossless JPEG crop actually covers.
+
+    jpegtran moves the left and top edges out to the MCU boundary, 8 pixels
+    times the largest sampling factor of the JPEG.
+
+    :param img: Opened JPEG image
+    :param crop_box: Requested crop box as (left, top, right, bottom)
+    :return: Crop box as (left, top, right, bottom)
+    """
+    # Pillow lists (id, horizontal, vertical, quantization table) per component
+    layers = getattr(img, "layer", None) or [(None, 2, 2, None)]
+    mcu_width = 8 * max(layer[1] for layer in layers)
+    mcu_height = 8 * max(layer[2] for layer in layers)
+    left, top, right, bottom = crop_box
+    return (left - left % mcu_width, top - top % mcu_height, right, bottom)
+
+
+def _center_crop_box(image_size, ratio):
+    """
+    Internal helper: Largest centered crop box of an image with the given aspect ratio.
+
+    :param image_size: Image size as (width, height)
+    :param ratio: Target aspect ratio (width / height)
+    :return: Crop box as (left, top, right, bottom)
+    """
+    image_width, image_height = image_size
+    if image_width / image_height > ratio:
+        new_width = int(image_height * ratio)
+        left = (image_width - new_width) // 2
+        return (left, 0, left + new_width, image_height)
+    new_height = int(image_width / ratio)
+    top = (image_height - new_height) // 2
+    return (0, top, image_width, top + new_height)
+
+
+def _decode_jpeg_scaled(image_data, min_size):
+    """
+    Internal helper: Decode an RGB JPEG with libjpeg-turbo, scaled down while decoding.
+
+    Picks the strongest 1/2, 1/4 or 1/8 IDCT scaling that keeps at least min_size
+    pixels. libjpeg-turbo releases the GIL while decoding.
+
+    :param image_data: JPEG file content as bytes
+    :param min_size: Minimum (width, height) of the decoded image
+    :return: Decoded PIL Image, or None if turbojpeg is unavailable or fails
+    """
+    if _TURBOJPEG is None:
+        return None
+    try:
+        src_width, src_height = _TURBOJPEG.decode_header(image_data)[:2]
+
+        scaling_factor = (1, 1)
+        for factor in ((1, 8), (1, 4), (1, 2)):
+            num, denom = factor
+            if (
+                -(-src_width * num // denom) >= min_size[0]
+                and -(-src_height * num // denom) >= min_size[1]
+            ):
+                scaling_factor = factor
+                break
+
+        pixels = _TURBOJPEG.decode(image_data, pixel_format=TJPF_RGB, scaling_factor=scaling_factor)
+    except (OSError, ValueError) as e:
+        print(f"WARNING: turbojpeg decode failed ({e}), decoding with Pillow instead")
+        return None
+    return Image.fromarray(pixels)
+
+
+def _front_jpeg_cache_key(
     image_path,
     page_size,
-    border_thickness=5,
-    auto_rotate_image=True,
-    compression_quality=85,
+    border_thickness,
+    auto_rotate_image,
+    compression_quality,
+):
+    """Internal helper: Key of a front image in _FRONT_JPEG_CACHE (file version and settings)"""
+    return (
+        image_path,
+        os.stat(image_path).st_mtime_ns,
+        tuple(page_size),
+        border_thickness,
+        auto_rotate_image,
+        compression_quality,
+    )
+
+
+def _prepare_front_jpeg(
+    image_path,
+    page_size,
+    border_thickness,
+    auto_rotate_image,
+    compression_quality,
 ):
     """
-    Internal helper: Draw an image on an existing canvas.
+    Internal helper: Turn a front image into the JPEG data drawn on the page.
+
+    Results are cached per file (path and modification time) and settings, so
+    drawing the same front image again skips decoding and re-encoding.
 
-    :param c: ReportLab canvas object
     :param image_path: Path to the front image
     :param page_size: Page size tuple (width, height)
-    :param border_thickness: Border size in points (default=5)
-    :param auto_rotate_image: Automatically rotate portrait images to landscape (default=True)
-    :param compression_quality: JPEG quality for non-JPEG images (1-100, default=85)
+    :param border_thickness: Border size in points
+    :param auto_rotate_image: Automatically rotate portrait images to landscape
+    :param compression_quality: JPEG quality for non-JPEG images (1-100)
+    :return: Tuple of (JPEG data as bytes, whether it has to be fitted into the
+        page keeping its aspect ratio)
+    """
+    cache_key = _front_jpeg_cache_key(
+        image_path, page_size, border_thickness, auto_rotate_image, compression_quality
+    )
+    if cache_key in _FRONT_JPEG_CACHE:
+        return _FRONT_JPEG_CACHE[cache_key]
+
+    front_jpeg = _process_front_image(
+        image_path, page_size, border_thickness, auto_rotate_image, compression_quality
+    )
+    if len(_FRONT_JPEG_CACHE) >= _FRONT_JPEG_CACHE_MAXSIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _FRONT_JPEG_CACHE[next(iter(_FRONT_JPEG_CACHE))]
+    _FRONT_JPEG_CACHE[cache_key] = front_jpeg
+    return front_jpeg
+
+
+def _process_front_image(
+    image_path,
+    page_size,
+    border_thickness,
+    auto_rotate_image,
+    compression_quality,
+):
+    """
+    Internal helper: Rotate, crop and convert a front image as needed (uncached).
+
+    See _prepare_front_jpeg for parameters and return value.
     """
     width, height = page_size
 
+    # Read the file once; Pillow parses only the header here and the JPEG fast
+    # path below embeds the same bytes
+    with open(image_path, "rb") as image_file:
+        image_data = image_file.read()
+
     # Load image metadata to check dimensions and format
-    img = Image.open(image_path)
+    img = Image.open(io.BytesIO(image_data))
     img_format = img.format
     needs_processing = False
 
@@ -132,11 +489,139 @@ def _draw_image_on_canvas(
     if abs(img_ratio - page_ratio) > 0.01:  # Tolerance for aspect ratio difference
         needs_processing = True
 
+    will_rotate = auto_rotate_image and img.height > img.width
+
+    # A portrait JPEG that only needs rotating can be rotated without re-encoding
+    rotated_jpeg = None
+    if (
+        img_format == "JPEG"
+        and will_rotate
+        and abs(img.height / img.width - page_ratio) <= 0.01
+    ):
+        rotated_jpeg = _rotate_jpeg_lossless(image_path)
+
+    if rotated_jpeg is not None:
+        return rotated_jpeg, True
+
     # If image is JPEG and doesn't need processing, use it directly
     if img_format == "JPEG" and not needs_processing:
         # Direct JPEG embedding - keeps compression!
+        return image_data, True
+
+    # Target pixel size of the drawn image at print resolution
+    target_size = (
+        int((width - 2 * border_thickness) / 72 * FRONT_IMAGE_DPI),
+        int((height - 2 * border_thickness) / 72 * FRONT_IMAGE_DPI),
+    )
+
+    # A landscape JPEG that only needs cropping, and would not be downscaled
+    # afterwards, can be cropped without re-encoding
+    if img_format == "JPEG" and not will_rotate:
+        crop_box = _center_crop_box(img.size, page_ratio)
+        left, top, right, bottom = _jpeg_lossless_crop_box(img, crop_box)
+        if (
+            right - left <= target_size[0]
+            and bottom - top <= target_size[1]
+            and abs((right - left) / (bottom - top) - page_ratio) <= 0.01
+        ):
+            cropped_jpeg = _crop_jpeg_lossless(image_path, crop_box)
+            if cropped_jpeg is not None:
+                # Stretched like a re-encoded image, the crop is slightly off
+                # the page ratio and would leave an unpainted strip otherwise
+                return cropped_jpeg, False
+
+    # Image needs processing (rotate, crop, or format conversion).
+    # Work in source orientation (shrink -> crop -> rotate) so the rotation
+    # only touches the final, smallest image.
+
+    # Let the JPEG decoder downscale by 1/2, 1/4 or 1/8 while decoding,
+    # keeping at least the target size (in source orientation) so the crop
+    # below still covers the page. No-op for other formats.
+    source_target_size = target_size[::-1] if will_rotate else target_size
+    source_page_ratio = 1 / page_ratio if will_rotate else page_ratio
+    turbo_img = None
+    if img_format == "JPEG" and img.mode == "RGB":
+        turbo_img = _decode_jpeg_scaled(image_data, source_target_size)
+    if turbo_img is not None:
+        img = turbo_img
+    else:
+        img.draft(img.mode, source_target_size)
+
+    # Pillow only resizes palette and bilevel images with nearest neighbour,
+    # convert them first so the downscale below is smoothed
+    if img.mode == "P":
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+    elif img.mode == "1":
+        img = img.convert("L")
+
+    # Crop to match aspect ratio
+    crop_box = _center_crop_box(img.size, source_page_ratio)
+
+    # Crop and downscale to print resolution in one resampling pass; the
+    # reducing_gap lets Pillow box-reduce large sources first. Only ever shrinks.
+    crop_width = crop_box[2] - crop_box[0]
+    crop_height = crop_box[3] - crop_box[1]
+    scale = min(
+        source_target_size[0] / crop_width, source_target_size[1] / crop_height
+    )
+    if scale < 1:
+        img = img.resize(
+            (max(1, round(crop_width * scale)), max(1, round(crop_height * scale))),
+            Image.Resampling.LANCZOS,
+            box=crop_box,
+            reducing_gap=2.0,
+        )
+    else:
+        img = img.crop(crop_box)
+
+    # Automatically rotate to landscape if image is in portrait
+    # (transpose only reorders pixels, unlike the resampling rotate())
+    if will_rotate:
+        img = img.transpose(Image.Transpose.ROTATE_90)
+
+    # Convert to RGB if necessary (for PNG with transparency, etc.)
+    if img.mode in ("RGBA", "LA"):
+        # Create white background
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        # Composite in C with only the alpha band extracted (split() would
+        # copy every band)
+        background.paste(img, mask=img.getchannel("A"))
+        img = background
+    elif img.mode != "RGB":
+        img = img.convert("RGB")
+
+    # Save processed image as compressed JPEG in memory
+    return _encode_jpeg(img, compression_quality), False
+
+
+def _draw_image_on_canvas(
+    c,
+    image_path,
+    page_size,
+    border_thickness=5,
+    auto_rotate_image=True,
+    compression_quality=85,
+):
+    """
+    Internal helper: Draw an image on an existing canvas.
+
+    :param c: ReportLab canvas object
+    :param image_path: Path to the front image
+    :param page_size: Page size tuple (width, height)
+    :param border_thickness: Border size in points (default=5)
+    :param auto_rotate_image: Automatically rotate portrait images to landscape (default=True)
+    :param compression_quality: JPEG quality for non-JPEG images (1-100, default=85)
+    """
+    width, height = page_size
+
+    jpeg_data, keep_aspect_ratio = _prepare_front_jpeg(
+        image_path, page_size, border_thickness, auto_rotate_image, compression_quality
+    )
+
+    # Draw image (ReportLab embeds the JPEG data as-is)
+    if keep_aspect_ratio:
         c.drawImage(
-            image_path,
+            ImageReader(io.BytesIO(jpeg_data)),
             border_thickness,
             border_thickness,
             width - 2 * border_thickness,
@@ -145,55 +630,14 @@ def _draw_image_on_canvas(
             anchor="c",
         )
     else:
-        # Image needs processing (rotate, crop, or format conversion)
-
-        # Automatically rotate to landscape if image is in portrait
-        if auto_rotate_image and img.height > img.width:
-            img = img.rotate(90, expand=True)
-            img_ratio = img.width / img.height
-
-        # Crop to match aspect ratio
-        if img_ratio > page_ratio:
-            new_width = int(img.height * page_ratio)
-            left = (img.width - new_width) // 2
-            img = img.crop((left, 0, left + new_width, img.height))
-        else:
-            new_height = int(img.width / page_ratio)
-            top = (img.height - new_height) // 2
-            img = img.crop((0, top, img.width, top + new_height))
-
-        # Save processed image as compressed JPEG to temp file
-        temp_img = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-        temp_img.close()
-
-        # Convert to RGB if necessary (for PNG with transparency, etc.)
-        if img.mode in ("RGBA", "LA", "P"):
-            # Create white background
-            background = Image.new("RGB", img.size, (255, 255, 255))
-            if img.mode == "P":
-                img = img.convert("RGBA")
-            background.paste(
-                img, mask=img.split()[-1] if img.mode in ("RGBA", "LA") else None
-            )
-            img = background
-        elif img.mode != "RGB":
-            img = img.convert("RGB")
-
-        # Save with compression
-        img.save(temp_img.name, "JPEG", quality=compression_quality, optimize=True)
-
-        # Draw compressed image
         c.drawImage(
-            temp_img.name,
+            ImageReader(io.BytesIO(jpeg_data)),
             border_thickness,
             border_thickness,
             width - 2 * border_thickness,
             height - 2 * border_thickness,
         )
 
-        # Clean up temp file
-        os.unlink(temp_img.name)
-
     # Draw white border
     if border_thickness > 0:
         c.setLineWidth(border_thickness)
@@ -206,6 +650,55 @@ def _draw_image_on_canvas(
         )
 
 
+def _build_front_page_bytes(
+    image_path,
+    page_size,
+    border_thickness,
+    auto_rotate_image,
+    compression_quality,
+):
+    """
+    Internal helper: Render an image front side into a one-page PDF in memory.
+
+    Batch modes build the front side once with this and add the parsed page as a
+    template for every postcard.
+
+    :param image_path: Path to the front image
+    :param page_size: Page size tuple
+    :param border_thickness: Border size in points
+    :param auto_rotate_image: Automatically rotate portrait images to landscape
+    :param compression_quality: JPEG quality for non-JPEG images (1-100)
+    :return: PDF data as bytes
+    """
+    front_buffer = io.BytesIO()
+    c = canvas.Canvas(front_buffer, pagesize=page_size, compress=True)
+    _draw_image_on_canvas(
+        c=c,
+        image_path=image_path,
+        page_size=page_size,
+        border_thickness=border_thickness,
+        auto_rotate_image=auto_rotate_image,
+        compression_quality=compression_quality,
+    )
+    c.save()
+    return front_buffer.getvalue()
+
+
+def _build_postcard(front_reader, back_page_bytes, output_file):
+    """
+    Internal helper: Write a two-page postcard from a prebuilt front and back side.
+
+    :param front_reader: PdfReader whose first page is the front side
+    :param back_page_bytes: Back side as one-page PDF data
+    :param output_file: Output PDF filename
+    """
+    pdf_writer = PdfWriter()
+    pdf_writer.append(front_reader, pages=(0, 1))
+    pdf_writer.append(PdfReader(io.BytesIO(back_page_bytes)), pages=(0, 1))
+    with open(output_file, "wb") as output_pdf_file:
+        pdf_writer.write(output_pdf_file)
+
+
 def generate_front_side_image(
     image_path,
     output_file,
@@ -252,9 +745,7 @@ def generate_front_side_pdf(
     :return: Path to generated PDF
     """
     pdf_writer = PdfWriter()
-    with open(image_path, "rb") as pdf_file:
-        pdf_reader = PdfReader(pdf_file)
-        pdf_writer.add_page(pdf_reader.pages[0])
+    pdf_writer.append(image_path, pages=(0, 1))
 
     with open(output_file, "wb") as output_pdf_file:
         pdf_writer.write(output_pdf_file)
@@ -358,7 +849,6 @@ def generate_postcard(
     """
     if warnings is None:
         warnings = []
-    width, height = page_size
 
     # Set up emoji cache directory if emoji support is enabled
     if enable_emoji:
@@ -367,6 +857,7 @@ def generate_postcard(
 
     # Check if input is a PDF or an image
     is_pdf_input = image_path.lower().endswith(".pdf")
+    font_name = register_font(font_path)
 
     processed_image_path = image_path
     if is_pdf_input:
@@ -375,31 +866,89 @@ def generate_postcard(
         format_pdf_for_postcard(image_path, temp_formatted.name)
         processed_image_path = temp_formatted.name
 
+    try:
+        _generate_postcard_inner(
+            processed_image_path=processed_image_path,
+            is_pdf_input=is_pdf_input,
+            message=message,
+            address=address,
+            output_file=output_file,
+            font_name=font_name,
+            page_size=page_size,
+            border_thickness=border_thickness,
+            show_debug_lines=show_debug_lines,
+            message_area_ratio=message_area_ratio,
+            auto_rotate_image=auto_rotate_image,
+            compression_quality=compression_quality,
+            enable_emoji=enable_emoji,
+            text_color=text_color,
+            url=url,
+            warnings=warnings,
+            category=category,
+            sender_text=sender_text,
+            skip_bleed_border=skip_bleed_border,
+        )
+    finally:
+        if is_pdf_input:
+            os.unlink(processed_image_path)
+
+
+def _generate_postcard_inner(
+    processed_image_path,
+    is_pdf_input,
+    message,
+    address,
+    output_file,
+    font_name,
+    page_size,
+    border_thickness,
+    show_debug_lines,
+    message_area_ratio,
+    auto_rotate_image,
+    compression_quality,
+    enable_emoji,
+    text_color,
+    url,
+    warnings,
+    category,
+    sender_text,
+    skip_bleed_border,
+    front_reader=None,
+    verbose=True,
+):
+    """
+    Internal helper: Generate one postcard from already prepared inputs.
+
+    Skips the per-call setup of generate_postcard (emoji cache directory, font
+    registration, input type check, PDF formatting), so batch mode can do it once.
+
+    :param processed_image_path: Path to the front image or formatted front PDF
+    :param is_pdf_input: Whether processed_image_path is a PDF
+    :param font_name: Name of an already registered font
+    :param warnings: List to collect warnings (one element is appended)
+    :param front_reader: Optional PdfReader of the front side, parsed once for a batch.
+        For image input a one-page PDF from _build_front_page_bytes, for PDF input
+        processed_image_path
+    :param verbose: Whether to print a message once the postcard is generated;
+        batch mode prints one summary instead
+    See generate_postcard for the remaining parameters.
+    """
     if is_pdf_input:
-        # PDF input: use existing PDF and overlay text annotations
-        font_name = register_font(font_path)
+        # PDF input: use existing PDF and overlay text annotations.
+        # pypdf reads the file into memory once; both pages are taken from this reader
+        if front_reader is not None:
+            pdf_reader = front_reader
+        else:
+            pdf_reader = PdfReader(processed_image_path)
 
         # Check if PDF has multiple pages
-        front_pdf_file = open(processed_image_path, "rb")
-        try:
-            pdf_reader = PdfReader(front_pdf_file)
-            num_pages = len(pdf_reader.pages)
-            has_second_page = num_pages >= 2
-            
-            # Keep references to pages before closing
-            front_page_ref = pdf_reader.pages[0]
-            back_page_ref = pdf_reader.pages[1] if has_second_page else None
-        finally:
-            # Don't close yet - we'll do it after we finish processing
-            pass
-
-        # Create temporary file for text overlay
-        temp_text_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        temp_text_pdf.close()
-
-        # Generate text overlay (with compression)
+        has_second_page = len(pdf_reader.pages) >= 2
+
+        # Generate text overlay in memory. An overlay for the existing back page is
+        # compressed once when it is embedded there, so it is not compressed here
+        text_buffer = io.BytesIO()
         text_warnings = {}
-        c = canvas.Canvas(temp_text_pdf.name, pagesize=page_size, compress=True)
+        c = canvas.Canvas(text_buffer, pagesize=page_size, compress=not has_second_page)
         generate_back_side(
             c=c,
             message=message,
@@ -416,6 +965,8 @@ def generate_postcard(
             sender_text=sender_text,
         )
         c.save()
+        text_buffer.seek(0)
+        text_reader = PdfReader(text_buffer)
 
         # Enrich warnings with card number (single postcard = card 1, page 2 for back side)
         enriched_warnings = enrich_warnings_with_card_info(text_warnings, card_number=1, page_offset=1)
@@ -424,30 +975,19 @@ def generate_postcard(
         # Merge pages
         pdf_writer = PdfWriter()
 
-        # Add the front side from input PDF (first page only)
-        pdf_writer.add_page(front_page_ref)
+        # Add the front side from the already parsed input PDF (first page only),
+        # copied as a whole. The back page below comes from the same reader, so
+        # objects shared by both pages (fonts, images) are copied only once.
+        pdf_writer.append(pdf_reader, pages=(0, 1))
 
         # Add the back side with text overlay
         if has_second_page:
-            # If PDF has second page, use it and overlay text annotations on top
-            text_pdf_file = open(temp_text_pdf.name, "rb")
-            try:
-                text_reader = PdfReader(text_pdf_file)
-                text_overlay = text_reader.pages[0]
-
-                # Merge: overlay text on the existing back page
-                back_page_ref.merge_page(text_overlay)
-                pdf_writer.add_page(back_page_ref)
-            finally:
-                text_pdf_file.close()
+            # If PDF has second page, use it and overlay text annotations on top,
+            # leaving the resources it shares with the front page untouched
+            _add_page_with_overlay(pdf_writer, pdf_reader.pages[1], text_reader.pages[0])
         else:
             # If only one page, just add the generated text side
-            text_pdf_file = open(temp_text_pdf.name, "rb")
-            try:
-                text_reader = PdfReader(text_pdf_file)
-                pdf_writer.add_page(text_reader.pages[0])
-            finally:
-                text_pdf_file.close()
+            pdf_writer.append(text_reader, pages=(0, 1))
 
         # Write the merged PDF
         with open(output_file, "wb") as output_pdf_file:
@@ -469,21 +1009,43 @@ def generate_postcard(
                 os.unlink(output_file)
             os.rename(temp_processed.name, output_file)
 
-        # Clean up resources
-        front_pdf_file.close()
-        if is_pdf_input:
-            os.unlink(processed_image_path)
-        os.unlink(temp_text_pdf.name)
+        if verbose:
+            if has_second_page:
+                print(f"Postcard generated successfully (using existing back page with text overlay): {output_file}")
+            else:
+                print(f"Postcard generated successfully (PDF merged): {output_file}")
 
-        if has_second_page:
-            print(f"Postcard generated successfully (using existing back page with text overlay): {output_file}")
-        else:
-            print(f"Postcard generated successfully (PDF merged): {output_file}")
+    elif front_reader is not None:
+        # Image input with a prebuilt front side: only render the back side
+        back_buffer = io.BytesIO()
+        text_warnings = {}
+        c = canvas.Canvas(back_buffer, pagesize=page_size, compress=True)
+        generate_back_side(
+            c=c,
+            message=message,
+            address=address,
+            font_name=font_name,
+            page_size=page_size,
+            show_debug_lines=show_debug_lines,
+            message_area_ratio=message_area_ratio,
+            enable_emoji=enable_emoji,
+            text_color=text_color,
+            url=url,
+            warnings=text_warnings,
+            category=category,
+            sender_text=sender_text,
+        )
+        c.save()
+
+        enriched_warnings = enrich_warnings_with_card_info(text_warnings, card_number=1, page_offset=1)
+        warnings.append(enriched_warnings)
+
+        _build_postcard(front_reader, back_buffer.getvalue(), output_file)
+        if verbose:
+            print(f"Postcard generated successfully: {output_file}")
 
     else:
         # Image input: generate both sides
-        font_name = register_font(font_path)
-        
         front_side_page_size = page_size
 
         if( skip_bleed_border ):
@@ -497,7 +1059,7 @@ def generate_postcard(
         # --- FRONT SIDE ---
         _draw_image_on_canvas(
             c=c,
-            image_path=image_path,
+            image_path=processed_image_path,
             page_size=front_side_page_size,
             border_thickness=border_thickness,
             auto_rotate_image=auto_rotate_image,
@@ -530,7 +1092,212 @@ def generate_postcard(
 
         # Save PDF
         c.save()
-        print(f"Postcard generated successfully: {output_file}")
+        if verbose:
+            print(f"Postcard generated successfully: {output_file}")
+
+
+def _init_batch_worker(font_path, emoji_cache_dir, front_page_bytes=None):
+    """
+    Internal helper: Prepare a batch worker process once.
+
+    Worker processes that are spawned instead of forked do not inherit the
+    registered fonts, the emoji cache directory or the prebuilt front side.
+
+    :param font_path: Path to TTF/OTF font file or name of built-in font
+    :param emoji_cache_dir: Emoji cache directory, or None if emoji support is disabled
+    :param front_page_bytes: Optional front side PDF data prepared by the parent process,
+        parsed here once for all postcards of this worker
+    """
+    global _BATCH_FRONT_READER
+    register_font(font_path)
+    if emoji_cache_dir is not None:
+        set_emoji_cache_dir(emoji_cache_dir)
+    if front_page_bytes is not None:
+        _BATCH_FRONT_READER = PdfReader(io.BytesIO(front_page_bytes))
+
+
+def _render_back_sides(job):
+    """
+    Internal helper: Render a chunk of back sides on one multi-page canvas.
+
+    Runs in a worker process, so it only takes and returns picklable data.
+
+    :param job: Tuple of (list of (message, address, url) per card, generate_back_side kwargs,
+        whether to compress the content streams)
+    :return: Tuple of (PDF bytes with one page per card, list of warnings dicts per card)
+    """
+    cards, back_side_kwargs, compress = job
+    back_buffer = io.BytesIO()
+    c = canvas.Canvas(back_buffer, pagesize=back_side_kwargs["page_size"], compress=compress)
+    card_warnings = []
+    for message, address, item_url in cards:
+        item_warnings = {}
+        generate_back_side(
+            c=c,
+            message=message,
+            address=address,
+            url=item_url,
+            warnings=item_warnings,
+            **back_side_kwargs,
+        )
+        c.showPage()
+        card_warnings.append(item_warnings)
+    c.save()
+    return back_buffer.getvalue(), card_warnings
+
+
+def _parse_back_sides(rendered_chunk):
+    """
+    Internal helper: Pair the pages of a chunk rendered by _render_back_sides with their warnings.
+
+    :param rendered_chunk: Tuple of (PDF bytes with one page per card, list of warnings dicts per card)
+    :return: Iterator of (back side PageObject, warnings dict)
+    """
+    back_pdf_bytes, card_warnings = rendered_chunk
+    back_reader = PdfReader(io.BytesIO(back_pdf_bytes))
+    return zip(back_reader.pages, card_warnings)
+
+
+def _render_back_side_pages(
+    cards, back_side_kwargs, max_workers, font_path, emoji_cache_dir, compress
+):
+    """
+    Internal helper: Render back sides, in parallel for larger batches.
+
+    The cards are split into one chunk per worker process, at most
+    MAX_BACK_SIDES_PER_CHUNK cards each. Each chunk is drawn on one multi-page
+    canvas, so the PDF overhead and the font subset are written once per chunk,
+    not once per card. Chunks are parsed and handed out one at a time.
+
+    :param cards: List of (message, address, url) tuples
+    See _generate_back_sides for the remaining parameters.
+    :return: Generator of (back side PageObject, warnings dict) in card order
+    """
+    num_workers = max(1, min(max_workers, len(cards) // MIN_BACK_SIDES_PER_WORKER))
+    chunk_size = min(-(-len(cards) // num_workers), MAX_BACK_SIDES_PER_CHUNK)
+    jobs = [
+        (cards[start:start + chunk_size], back_side_kwargs, compress)
+        for start in range(0, len(cards), chunk_size)
+    ]
+
+    if num_workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_batch_worker,
+            initargs=(font_path, emoji_cache_dir),
+        ) as executor:
+            # Keep at most two chunks per worker in flight: the workers render ahead
+            # while the pages of the oldest chunk are consumed, but finished chunks
+            # do not pile up in memory when consuming is slower than rendering.
+            # Futures are consumed in submission order, so pages stay in card order.
+            pending = deque()
+            for job in jobs:
+                if len(pending) >= 2 * num_workers:
+                    yield from _parse_back_sides(pending.popleft().result())
+                pending.append(executor.submit(_render_back_sides, job))
+            while pending:
+                yield from _parse_back_sides(pending.popleft().result())
+    else:
+        for job in jobs:
+            yield from _parse_back_sides(_render_back_sides(job))
+
+
+def _generate_back_sides(
+    messages_and_addresses,
+    url,
+    back_side_kwargs,
+    max_workers,
+    font_path,
+    emoji_cache_dir,
+    compress=True,
+):
+    """
+    Internal helper: Render the back sides of a batch.
+
+    Cards with the same message, address and URL get the same back side, so each
+    unique back side is rendered only once and its page is handed out for every
+    card that uses it. The PdfWriter then stores its content only once as well.
+
+    :param messages_and_addresses: List of dicts with 'message', 'address' and optional 'url' keys
+    :param url: Default URL for cards without their own
+    :param back_side_kwargs: generate_back_side kwargs shared by all cards
+    :param max_workers: Maximum number of worker processes (1 = no pool)
+    :param font_path: Font path, registered once in every worker
+    :param emoji_cache_dir: Emoji cache directory, or None if emoji support is disabled
+    :param compress: Compress the content streams. Pass False for overlays that are
+        drawn on another page, _add_page_with_overlay compresses them when embedding
+    :return: Generator of (back side PageObject, warnings dict) in card order
+    """
+    unique_slots = {}
+    card_slots = []
+    for item in messages_and_addresses:
+        card = (item.get("message", ""), item.get("address", ""), item.get("url", url))
+        card_slots.append(unique_slots.setdefault(card, len(unique_slots)))
+    last_use = {slot: idx for idx, slot in enumerate(card_slots)}
+
+    # Unique back sides are rendered in order of first use, so a card never needs
+    # one that is not rendered yet. Pages are dropped after their last use.
+    rendered_pages = _render_back_side_pages(
+        list(unique_slots), back_side_kwargs, max_workers, font_path, emoji_cache_dir, compress
+    )
+    pages_by_slot = {}
+    for idx, slot in enumerate(card_slots):
+        if slot not in pages_by_slot:
+            pages_by_slot[slot] = next(rendered_pages)
+        back_page, item_warnings = pages_by_slot[slot]
+        if last_use[slot] == idx:
+            pages_by_slot[slot] = None
+        yield back_page, item_warnings
+
+
+def _generate_splitted_postcard(job, front_reader=None):
+    """
+    Internal helper: Generate one postcard of a splitted batch.
+
+    Runs in a worker process, so it only takes and returns picklable data.
+
+    :param job: Tuple of (card_number, postcard_file, temp_dir, _generate_postcard_inner kwargs)
+    :param front_reader: PdfReader of the prebuilt front side; defaults to the one
+        parsed by _init_batch_worker, so it is not sent and parsed again for every job
+    :return: Tuple of (postcard_file, enriched warnings dict for this card)
+    """
+    idx, postcard_file, temp_dir, postcard_kwargs = job
+    is_pdf_input = postcard_kwargs["is_pdf_input"]
+    item_url = postcard_kwargs.get("url")
+    if front_reader is None:
+        front_reader = _BATCH_FRONT_READER
+
+    # Generate single postcard with local warnings list
+    card_warnings = []
+    _generate_postcard_inner(
+        output_file=postcard_file,
+        warnings=card_warnings,
+        front_reader=front_reader,
+        verbose=False,
+        **postcard_kwargs,
+    )
+
+    # Re-enrich with this card's number (every single postcard is numbered as card 1)
+    item_warnings = {
+        key: value
+        for key, value in card_warnings[0].items()
+        if key not in ("card_number", "page")
+    }
+    enriched_warnings = enrich_warnings_with_card_info(item_warnings, card_number=idx)
+
+    # QR Code postprocessing if PDF input and URL provided
+    if is_pdf_input and item_url:
+        qr_processed_path = os.path.join(temp_dir, f"qr_processed_{idx:04d}.pdf")
+        qr_code_postprocessor(
+            input_pdf_path=postcard_file,
+            placeholder_string="card4u.org/demoqrcode",
+            replacement_urls=[item_url],
+            output_pdf_path=qr_processed_path
+        )
+        # Replace original with processed
+        os.replace(qr_processed_path, postcard_file)
+
+    return postcard_file, enriched_warnings
 
 
 def generate_postcard_batch(
@@ -553,6 +1320,7 @@ def generate_postcard_batch(
     category=None,
     sender_text="",
     skip_bleed_border=False,
+    max_workers: Optional[int] = 1,
 ):
     """
     Generate multiple postcards in batch mode.
@@ -576,317 +1344,290 @@ def generate_postcard_batch(
     :param text_color: Text color for message and address (default='black')
     :param url: Optional URL to display as QR code in bottom right corner (default=None)
     :param warnings: Optional list to collect warnings (one element per card, even if empty)
+    :param max_workers: Number of worker processes (default=1, no pool; None = CPU count).
+        With more than one worker, scripts must guard their entry point with
+        if __name__ == "__main__": on platforms that spawn processes (Windows, macOS)
     :return: List of generated file paths
     """
     if warnings is None:
         warnings = []
     if not messages_and_addresses:
         raise ValueError("messages_and_addresses list cannot be empty")
+    start_time = time.perf_counter()
 
     # Set up emoji cache directory if emoji support is enabled
+    emoji_cache_dir = None
     if enable_emoji:
         emoji_cache_dir = os.path.join(os.path.dirname(__file__), ".emoji_cache")
         set_emoji_cache_dir(emoji_cache_dir)
+        # Resolve the emoji images of all cards once, before the per-card loops
+        prewarm_emoji_cache(
+            text
+            for item in messages_and_addresses
+            for text in (item.get("message", ""), item.get("address", ""))
+        )
 
     # Register font once
     font_name = register_font(font_path)
     is_pdf_input = image_path.lower().endswith(".pdf")
 
-    processed_image_path = image_path
-    if is_pdf_input:
-        temp_formatted = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        temp_formatted.close()
-        format_pdf_for_postcard(image_path, temp_formatted.name)
-        processed_image_path = temp_formatted.name
-
-    generated_files = []
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
 
-    if mode == "compact":
-        # Single PDF: one front side + all message sides
-        pdf_writer = PdfWriter()
-
-        # Generate and add front side
-        temp_front = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        temp_front.close()
+    # Back side settings shared by all cards of compact and joined mode
+    back_side_kwargs = dict(
+        font_name=font_name,
+        page_size=page_size,
+        show_debug_lines=show_debug_lines,
+        message_area_ratio=message_area_ratio,
+        enable_emoji=enable_emoji,
+        text_color=text_color,
+        category=category,
+        sender_text=sender_text,
+    )
 
+    # All temporary files of this batch live in one directory, removed at once at the end
+    with tempfile.TemporaryDirectory(prefix="postcard_batch_") as temp_dir:
+        processed_image_path = image_path
         if is_pdf_input:
-            with open(processed_image_path, "rb") as pdf_file:
-                pdf_reader = PdfReader(pdf_file)
-                pdf_writer.add_page(pdf_reader.pages[0])
-        else:
-
-            front_side_page_size = page_size
+            processed_image_path = os.path.join(temp_dir, "formatted.pdf")
+            format_pdf_for_postcard(image_path, processed_image_path)
 
-            if( skip_bleed_border ):
-                size = postcardformats.get_default_postcard_size_with_bleeding()
-                front_side_page_size = (size[0]*mm, size[1]*mm)
+        generated_files = []
 
-            
+        if mode == "compact":
+            # Single PDF: one front side + all message sides
+            pdf_writer = PdfWriter()
 
-            c = canvas.Canvas(temp_front.name, pagesize=front_side_page_size, compress=True)
-            _draw_image_on_canvas(
-                c=c,
-                image_path=image_path,
-                page_size=front_side_page_size,
-                border_thickness=border_thickness,
-                auto_rotate_image=auto_rotate_image,
-                compression_quality=compression_quality,
-            )
-            c.save()
+            # Generate and add front side
+            if is_pdf_input:
+                with open(processed_image_path, "rb") as pdf_file:
+                    pdf_reader = PdfReader(pdf_file)
+                    pdf_writer.add_page(pdf_reader.pages[0])
+            else:
 
-            with open(temp_front.name, "rb") as pdf_file:
-                pdf_reader = PdfReader(pdf_file)
-                pdf_writer.add_page(pdf_reader.pages[0])
+                front_side_page_size = page_size
 
-        # Generate and add all message sides
-        for idx, item in enumerate(messages_and_addresses, 1):
-            message = item.get("message", "")
-            address = item.get("address", "")
-            item_url = item.get("url", url)
-            item_warnings = {}
-
-            temp_back = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            temp_back.close()
-
-            c = canvas.Canvas(temp_back.name, pagesize=page_size, compress=True)
-            generate_back_side(
-                c=c,
-                message=message,
-                address=address,
-                font_name=font_name,
-                page_size=page_size,
-                show_debug_lines=show_debug_lines,
-                message_area_ratio=message_area_ratio,
-                enable_emoji=enable_emoji,
-                text_color=text_color,
-                url=item_url,
-                warnings=item_warnings,
-                category=category,
-                sender_text=sender_text,
-            )
-            c.save()
+                if( skip_bleed_border ):
+                    size = postcardformats.get_default_postcard_size_with_bleeding()
+                    front_side_page_size = (size[0]*mm, size[1]*mm)
 
-            # Enrich warnings with card number and page info, add to list
-            enriched_warnings = enrich_warnings_with_card_info(item_warnings, card_number=idx, page_offset=1)
-            warnings.append(enriched_warnings)
+            
 
-            with open(temp_back.name, "rb") as pdf_file:
-                pdf_reader = PdfReader(pdf_file)
+                front_pdf_bytes = _build_front_page_bytes(
+                    image_path=image_path,
+                    page_size=front_side_page_size,
+                    border_thickness=border_thickness,
+                    auto_rotate_image=auto_rotate_image,
+                    compression_quality=compression_quality,
+                )
+                pdf_reader = PdfReader(io.BytesIO(front_pdf_bytes))
                 pdf_writer.add_page(pdf_reader.pages[0])
 
-            os.unlink(temp_back.name)
-
-        # Write final PDF with compression
-        with open(output_file, "wb") as output_pdf:
-            pdf_writer.write(output_pdf)
-
-        if not is_pdf_input:
-            os.unlink(temp_front.name)
+            # Generate and add all message sides
+            for idx, (back_page, item_warnings) in enumerate(
+                _generate_back_sides(
+                    messages_and_addresses, url, back_side_kwargs, max_workers, font_path, emoji_cache_dir
+                ),
+                1,
+            ):
+                # Enrich warnings with card number and page info, add to list
+                enriched_warnings = enrich_warnings_with_card_info(item_warnings, card_number=idx, page_offset=1)
+                warnings.append(enriched_warnings)
 
-        generated_files.append(output_file)
-        print(f"Compact postcard batch generated: {output_file}")
+                pdf_writer.add_page(back_page)
 
-    elif mode == "joined":
-        # Single PDF: alternating front and back sides
-        # OPTIMIZATION: Keep front page in memory and reuse it for all postcards
-        pdf_writer = PdfWriter()
+            # Write final PDF with compression
+            with open(output_file, "wb") as output_pdf:
+                pdf_writer.write(output_pdf)
 
-        # Load or generate front side and check for existing back page
-        if is_pdf_input:
-            # Load from existing PDF - keep file open for duration
-            front_pdf_file = open(processed_image_path, "rb")
-            front_pdf_reader = PdfReader(front_pdf_file)
-            front_page = front_pdf_reader.pages[0]
-            
-            # Check if PDF has multiple pages (existing back page)
-            has_existing_back_page = len(front_pdf_reader.pages) >= 2
-            existing_back_page = front_pdf_reader.pages[1] if has_existing_back_page else None
-            
-            should_close_front = True
-            temp_front_name = None
-        else:
-            # Generate image-based front side
-            temp_front = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            temp_front.close()
-            
-            c = canvas.Canvas(temp_front.name, pagesize=page_size, compress=True)
-            _draw_image_on_canvas(
-                c=c,
-                image_path=image_path,
-                page_size=page_size,
-                border_thickness=border_thickness,
-                auto_rotate_image=auto_rotate_image,
-                compression_quality=compression_quality,
+            generated_files.append(output_file)
+            print(
+                f"Compact postcard batch generated: {output_file} "
+                f"({len(messages_and_addresses)} cards in {time.perf_counter() - start_time:.1f}s)"
             )
-            c.save()
 
-            front_pdf_file = open(temp_front.name, "rb")
-            front_pdf_reader = PdfReader(front_pdf_file)
-            front_page = front_pdf_reader.pages[0]
+        elif mode == "joined":
+            # Single PDF: alternating front and back sides
+            # OPTIMIZATION: Keep front page in memory and reuse it for all postcards
+            pdf_writer = PdfWriter()
+
+            # Load or generate front side and check for existing back page
+            if is_pdf_input:
+                # Load from existing PDF - keep file open for duration
+                front_pdf_file = open(processed_image_path, "rb")
+                front_pdf_reader = PdfReader(front_pdf_file)
+                front_page = front_pdf_reader.pages[0]
             
-            # No existing back page for image-based input
-            has_existing_back_page = False
-            existing_back_page = None
-            
-            should_close_front = True
-            temp_front_name = temp_front.name
-
-        try:
-            # Add front + back pairs
-            for idx, item in enumerate(messages_and_addresses, 1):
-                # Add front side (clone the page so it doesn't depend on the reader)
-                pdf_writer.add_page(front_page)
-
-                # Generate and add back side
-                message = item.get("message", "")
-                address = item.get("address", "")
-                item_url = item.get("url", url)
-                item_warnings = {}
-
-                temp_back = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-                temp_back.close()
-
-                c = canvas.Canvas(temp_back.name, pagesize=page_size, compress=True)
-                generate_back_side(
-                    c=c,
-                    message=message,
-                    address=address,
-                    font_name=font_name,
-                    page_size=page_size,
-                    show_debug_lines=show_debug_lines,
-                    message_area_ratio=message_area_ratio,
-                    enable_emoji=enable_emoji,
-                    text_color=text_color,
-                    url=item_url,
-                    warnings=item_warnings,
-                    category=category,
-                    sender_text=sender_text,
+                # Check if PDF has multiple pages (existing back page)
+                has_existing_back_page = len(front_pdf_reader.pages) >= 2
+                existing_back_page = front_pdf_reader.pages[1] if has_existing_back_page else None
+            else:
+                # Generate image-based front side once, in memory
+                front_pdf_file = io.BytesIO(
+                    _build_front_page_bytes(
+                        image_path=image_path,
+                        page_size=page_size,
+                        border_thickness=border_thickness,
+                        auto_rotate_image=auto_rotate_image,
+                        compression_quality=compression_quality,
+                    )
                 )
-                c.save()
+                front_pdf_reader = PdfReader(front_pdf_file)
+                front_page = front_pdf_reader.pages[0]
+            
+                # No existing back page for image-based input
+                has_existing_back_page = False
+                existing_back_page = None
 
-                # Enrich warnings with card number and page info, add to list
-                enriched_warnings = enrich_warnings_with_card_info(item_warnings, card_number=idx, page_offset=1)
-                warnings.append(enriched_warnings)
+            # Objects shared by the back pages: the content streams around the text
+            # overlays, and the overlay of a back side that is used by several cards
+            overlay_shared_objects = {}
 
-                temp_back_file = open(temp_back.name, "rb")
-                try:
-                    temp_back_reader = PdfReader(temp_back_file)
-                    text_overlay = temp_back_reader.pages[0]
+            try:
+                # Add front + back pairs
+                for idx, (text_overlay, item_warnings) in enumerate(
+                    _generate_back_sides(
+                        messages_and_addresses,
+                        url,
+                        back_side_kwargs,
+                        max_workers,
+                        font_path,
+                        emoji_cache_dir,
+                        compress=not has_existing_back_page,
+                    ),
+                    1,
+                ):
+                    # Enrich warnings with card number and page info, add to list
+                    enriched_warnings = enrich_warnings_with_card_info(item_warnings, card_number=idx, page_offset=1)
+                    warnings.append(enriched_warnings)
+
+                    # Add front side. Always add the same parsed page template: the writer
+                    # clones only the page dict and maps its content stream and resources
+                    # (the front image XObject) to the objects copied on the first add, so
+                    # they are stored only once in the output, not once per postcard.
+                    pdf_writer.add_page(front_page)
 
                     if has_existing_back_page:
                         # Overlay text on a fresh copy of the existing back page
-                        # Need to read a fresh page from the PDF file to avoid accumulation
-                        with open(processed_image_path, "rb") as fresh_pdf:
-                            fresh_reader = PdfReader(fresh_pdf)
-                            fresh_back_page = fresh_reader.pages[1]
-                            fresh_back_page.merge_page(text_overlay)
-                            pdf_writer.add_page(fresh_back_page)
+                        # (parsed once) to avoid accumulating overlays
+                        _add_page_with_overlay(
+                            pdf_writer, existing_back_page, text_overlay, overlay_shared_objects
+                        )
                     else:
                         # Use the generated text side directly
                         pdf_writer.add_page(text_overlay)
-                finally:
-                    temp_back_file.close()
-
-                os.unlink(temp_back.name)
 
-            # Write final PDF with compression
-            with open(output_file, "wb") as output_pdf:
-                pdf_writer.write(output_pdf)
+                # Write final PDF with compression
+                with open(output_file, "wb") as output_pdf:
+                    pdf_writer.write(output_pdf)
+
+                # QR Code postprocessing if PDF input and URLs provided
+                if is_pdf_input and any(item.get("url") for item in messages_and_addresses):
+                    replacement_urls = [item.get("url") for item in messages_and_addresses if item.get("url")]
+                    if replacement_urls:
+                        qr_processed_path = os.path.join(temp_dir, "qr_processed.pdf")
+                        qr_code_postprocessor(
+                            input_pdf_path=output_file,
+                            placeholder_string="https://card4u.org/demoqrcode",
+                            replacement_urls=replacement_urls,
+                            output_pdf_path=qr_processed_path,
+                            pages_per_card=2
+                        )
+                        # Replace original with processed
+                        os.replace(qr_processed_path, output_file)
 
-            # QR Code postprocessing if PDF input and URLs provided
-            if is_pdf_input and any(item.get("url") for item in messages_and_addresses):
-                replacement_urls = [item.get("url") for item in messages_and_addresses if item.get("url")]
-                if replacement_urls:
-                    temp_processed = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-                    temp_processed.close()
-                    qr_code_postprocessor(
-                        input_pdf_path=output_file,
-                        placeholder_string="https://card4u.org/demoqrcode",
-                        replacement_urls=replacement_urls,
-                        output_pdf_path=temp_processed.name,
-                        pages_per_card=2
-                    )
-                    # Replace original with processed
-                    if os.path.exists(output_file):
-                        os.unlink(output_file)
-                    os.rename(temp_processed.name, output_file)
-
-        finally:
-            # Close and cleanup
-            if should_close_front:
+            finally:
+                # Close and cleanup
                 front_pdf_file.close()
-                if temp_front_name:
-                    os.unlink(temp_front_name)
-
-        generated_files.append(output_file)
-        print(f"Joined postcard batch generated: {output_file}")
-
-    elif mode == "splitted":
-        # Multiple PDFs, one per postcard
-        if output_directory is None:
-            output_directory = os.path.dirname(output_file) or "."
 
-        base_name = os.path.splitext(os.path.basename(output_file))[0]
-
-        for idx, item in enumerate(messages_and_addresses, 1):
-            postcard_file = os.path.join(
-                output_directory, f"{base_name}_{idx:03d}.pdf"
+            generated_files.append(output_file)
+            print(
+                f"Joined postcard batch generated: {output_file} "
+                f"({len(messages_and_addresses)} cards in {time.perf_counter() - start_time:.1f}s)"
             )
 
-            message = item.get("message", "")
-            address = item.get("address", "")
-            item_url = item.get("url", url)
-            item_warnings = {}
-
-            # Generate single postcard with local warnings dict
-            generate_postcard(
-                image_path=image_path,
-                message=message,
-                address=address,
-                output_file=postcard_file,
-                font_path=font_path,
-                page_size=page_size,
-                border_thickness=border_thickness,
-                show_debug_lines=show_debug_lines,
-                message_area_ratio=message_area_ratio,
-                auto_rotate_image=auto_rotate_image,
-                compression_quality=compression_quality,
-                enable_emoji=enable_emoji,
-                text_color=text_color,
-                url=item_url,
-                warnings=item_warnings,
-                sender_text=sender_text,
-            )
+        elif mode == "splitted":
+            # Multiple PDFs, one per postcard
+            if output_directory is None:
+                output_directory = os.path.dirname(output_file) or "."
 
-            # Enrich warnings with card number and page info, add to list
-            enriched_warnings = enrich_warnings_with_card_info(item_warnings, card_number=idx)
-            warnings.append(enriched_warnings)
-
-            # QR Code postprocessing if PDF input and URL provided
-            if is_pdf_input and item_url:
-                temp_processed = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-                temp_processed.close()
-                qr_code_postprocessor(
-                    input_pdf_path=postcard_file,
-                    placeholder_string="card4u.org/demoqrcode",
-                    replacement_urls=[item_url],
-                    output_pdf_path=temp_processed.name
+            base_name = os.path.splitext(os.path.basename(output_file))[0]
+
+            # Build the shared front side once; every card only renders its back
+            # side and is assembled with this front page instead of drawing it again
+            if is_pdf_input:
+                with open(processed_image_path, "rb") as pdf_file:
+                    front_page_bytes = pdf_file.read()
+            else:
+                front_page_bytes = _build_front_page_bytes(
+                    image_path=image_path,
+                    page_size=page_size,
+                    border_thickness=border_thickness,
+                    auto_rotate_image=auto_rotate_image,
+                    compression_quality=compression_quality,
                 )
-                # Replace original with processed
-                os.rename(temp_processed.name, postcard_file)
 
-            generated_files.append(postcard_file)
+            jobs = []
+            for idx, item in enumerate(messages_and_addresses, 1):
+                postcard_file = os.path.join(
+                    output_directory, f"{base_name}_{idx:03d}.pdf"
+                )
+                # The input PDF was formatted once above, every card reuses it
+                postcard_kwargs = dict(
+                    processed_image_path=processed_image_path,
+                    is_pdf_input=is_pdf_input,
+                    message=item.get("message", ""),
+                    address=item.get("address", ""),
+                    font_name=font_name,
+                    page_size=page_size,
+                    border_thickness=border_thickness,
+                    show_debug_lines=show_debug_lines,
+                    message_area_ratio=message_area_ratio,
+                    auto_rotate_image=auto_rotate_image,
+                    compression_quality=compression_quality,
+                    enable_emoji=enable_emoji,
+                    text_color=text_color,
+                    url=item.get("url", url),
+                    category=None,
+                    sender_text=sender_text,
+                    skip_bleed_border=False,
+                )
+                jobs.append((idx, postcard_file, temp_dir, postcard_kwargs))
+
+            # Every postcard is independent, so generate them in parallel processes.
+            # Workers reuse the on-disk emoji cache set up above.
+            max_workers = min(max_workers, len(jobs))
+
+            if max_workers > 1:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_batch_worker,
+                    initargs=(font_path, emoji_cache_dir, front_page_bytes),
+                ) as executor:
+                    # Send jobs in chunks to cut inter-process round trips
+                    chunksize = max(1, len(jobs) // (max_workers * 4))
+                    results = list(
+                        executor.map(_generate_splitted_postcard, jobs, chunksize=chunksize)
+                    )
+            else:
+                front_reader = PdfReader(io.BytesIO(front_page_bytes))
+                results = [_generate_splitted_postcard(job, front_reader) for job in jobs]
 
-        print(f"Splitted postcard batch generated: {len(generated_files)} files")
+            # Results keep the input order, so warnings stay one element per card
+            for postcard_file, enriched_warnings in results:
+                warnings.append(enriched_warnings)
+                generated_files.append(postcard_file)
 
-    else:
-        raise ValueError(
-            f"Invalid mode: {mode}. Must be 'compact', 'joined', or 'splitted'"
-        )
+            print(
+                f"Splitted postcard batch generated: {len(generated_files)} files "
+                f"in {time.perf_counter() - start_time:.1f}s"
+            )
 
-    # Clean up formatted PDF if used
-    if is_pdf_input:
-        os.unlink(processed_image_path)
+        else:
+            raise ValueError(
+                f"Invalid mode: {mode}. Must be 'compact', 'joined', or 'splitted'"
+            )
 
     return generated_files
 
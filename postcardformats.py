@@ -1,6 +1,9 @@
+from functools import lru_cache
+from types import MappingProxyType
+
 # Constants for standard postcard sizes (in mm)
 # TODO Besprechen
-paper_Standards = {
+paper_Standards = MappingProxyType({
     "A0": (841, 1189),
     "A1": (594, 841),
     "A2": (420, 594),
@@ -21,7 +24,7 @@ paper_Standards = {
     "A8": (52, 74),
     "A9": (37, 52),
     "A10": (26, 37),
-}
+})  # Read-only, so the shared table cannot be changed by a caller
 
 
 supported_formats = ["A6+"]  # Supported postcard formats
@@ -30,6 +33,7 @@ default_format = "A6"  # Default postcard format
 default_format_with_bleed = "A6+"  # Default postcard format with bleed area
 
 
+@lru_cache(maxsize=None)
 def get_postcard_size(format_name):  # in postcard style...
     """Get the dimensions of the postcard format in mm."""
     if format_name in paper_Standards:
@@ -38,21 +42,26 @@ def get_postcard_size(format_name):  # in postcard style...
         raise ValueError(f"Unsupported postcard format: {format_name}")
 
 
+# Default sizes in mm, computed once at import
+default_postcard_size = get_postcard_size(default_format)
+default_postcard_size_with_bleeding = get_postcard_size(default_format_with_bleed)
+# Bleed area - default postcard size, on each side
+default_cutting_size = (
+    (default_postcard_size_with_bleeding[0] - default_postcard_size[0]) / 2,
+    (default_postcard_size_with_bleeding[1] - default_postcard_size[1]) / 2,
+)
+
+
 def get_default_postcard_size():
     """Get the default postcard size in mm."""
-    return get_postcard_size(default_format)
+    return default_postcard_size
 
 
 def get_default_cutting_size():
     """returns the default cutting size in mm: bleed area - default postcard size"""
-    bleed_area = get_postcard_size(default_format_with_bleed)
-    postcard_size = get_postcard_size(default_format)
-    return (
-        (bleed_area[0] - postcard_size[0]) / 2,
-        (bleed_area[1] - postcard_size[1]) / 2,
-    )
+    return default_cutting_size
 
 
 def get_default_postcard_size_with_bleeding():
     """Get the default postcard size with bleed area in mm."""
-    return get_postcard_size(default_format_with_bleed)
+    return default_postcard_size_with_bleeding
@@ -1,33 +1,327 @@
+import math
+import re
+import shutil
+
+from pypdf import PdfReader
+from pypdf.generic import ArrayObject, ContentStream, PdfObject
+
 # Try relative import first (when used as module), fall back to direct import (when run standalone)
 try:
-    from .crop_to_size import process_pdf_for_print
+    from .crop_to_size import process_pdf_for_print, get_page_dimensions_in_mm
     from .draw_bleed_area import draw_cutting_area
     from .set_crop_markers import add_crop_marks_to_pdf
     from . import postcardformats
     from .convert_CMYK import convertPDFtoCMYK
 except ImportError:
-    from crop_to_size import process_pdf_for_print
+    from crop_to_size import process_pdf_for_print, get_page_dimensions_in_mm
     from draw_bleed_area import draw_cutting_area
     from set_crop_markers import add_crop_marks_to_pdf
     import postcardformats
     from convert_CMYK import convertPDFtoCMYK
 
 
+# Settings of the Ghostscript conversion in convertPDFtoCMYK that a PDF must
+# already meet to be used as is: PDF 1.4 (CompatibilityLevel), and color images
+# resampled to 300 dpi above the default downsample threshold of 1.5 times that
+_MAX_PDF_VERSION = (1, 4)
+_MAX_COLOR_IMAGE_DPI = 300 * 1.5
+
+# Abbreviated color space names of inline images
+_INLINE_COLOR_SPACE_NAMES = {
+    "/G": "/DeviceGray",
+    "/RGB": "/DeviceRGB",
+    "/CMYK": "/DeviceCMYK",
+    "/I": "/Indexed",
+}
+
+
+def _cmyk_or_gray_components(colorspace):
+    """
+    Number of components of a DeviceCMYK/DeviceGray color space or an equivalent
+    ICC/indexed space: 4 for CMYK, 1 for gray and None for any other color space.
+    """
+    if isinstance(colorspace, PdfObject):
+        colorspace = colorspace.get_object()
+    if isinstance(colorspace, str):
+        return {"/DeviceCMYK": 4, "/DeviceGray": 1}.get(colorspace)
+    if isinstance(colorspace, ArrayObject) and len(colorspace) >= 2:
+        family = colorspace[0]
+        if family == "/ICCBased":
+            components = colorspace[1].get_object().get("/N")
+            return components if components in (1, 4) else None
+        if family == "/Indexed":
+            return _cmyk_or_gray_components(colorspace[1])
+    return None
+
+
+def _resolve_colorspace(colorspace, colorspaces):
+    """
+    Resolve a color space operand of cs/CS or an inline image: a device color
+    space name, its inline image abbreviation or the name of a /ColorSpace resource.
+
+    :return: The color space, or None for an unknown resource name
+    """
+    if isinstance(colorspace, ArrayObject):
+        if len(colorspace) >= 2 and colorspace[0] in ("/I", "/Indexed"):
+            return ArrayObject(
+                ["/Indexed", _resolve_colorspace(colorspace[1], colorspaces), *colorspace[2:]]
+            )
+        return colorspace
+    if not isinstance(colorspace, str):
+        return None
+    colorspace = _INLINE_COLOR_SPACE_NAMES.get(colorspace, colorspace)
+    # Device color space names never refer to resources
+    if colorspace in ("/DeviceGray", "/DeviceRGB", "/DeviceCMYK", "/Pattern"):
+        return colorspace
+    return colorspaces.get(colorspace)
+
+
+def _multiply_matrix(matrix, ctm):
+    """Internal helper: Concatenate a cm matrix with the CTM, scale and rotation part only."""
+    a, b, c, d = (float(value) for value in matrix[:4])
+    a2, b2, c2, d2 = ctm
+    return (a * a2 + b * c2, a * b2 + b * d2, c * a2 + d * c2, c * b2 + d * d2)
+
+
+def _is_print_ready_image(image, colorspace, ctm):
+    """
+    Check if an image (XObject dict or inline image settings) is CMYK or gray and
+    would not be resampled or re-encoded by the Ghostscript conversion.
+
+    :param image: Image dict, inline images use the abbreviated keys
+    :param colorspace: Resolved color space of the image
+    :param ctm: Scale part of the CTM the image is drawn with
+    """
+    if image.get("/ImageMask", image.get("/IM")):
+        # Stencil masks are painted in the current fill color
+        return True
+    components = _cmyk_or_gray_components(colorspace)
+    if components is None:
+        return False
+    filters = image.get("/Filter", image.get("/F"))
+    if "/JPXDecode" in (filters if isinstance(filters, list) else [filters]):
+        # JPEG 2000 needs PDF 1.5
+        return False
+    if components > 1:
+        # Only color images are downsampled, gray downsampling is turned off
+        for pixels, size_pt in (
+            (image.get("/Width", image.get("/W")), math.hypot(ctm[0], ctm[1])),
+            (image.get("/Height", image.get("/H")), math.hypot(ctm[2], ctm[3])),
+        ):
+            if pixels is None:
+                return False
+            if size_pt and pixels * 72 / size_pt > _MAX_COLOR_IMAGE_DPI:
+                return False
+    return True
+
+
+def _is_embedded_font(font):
+    """Check if a font program is embedded, the /prepress setting embeds all fonts."""
+    font = font.get_object()
+    if font.get("/Subtype") == "/Type3":
+        # Glyphs are content streams of their own, not checked
+        return False
+    if font.get("/Subtype") == "/Type0":
+        descendants = font.get("/DescendantFonts")
+        if not descendants:
+            return False
+        font = descendants.get_object()[0].get_object()
+    descriptor = font.get("/FontDescriptor")
+    if descriptor is None:
+        return False
+    descriptor = descriptor.get_object()
+    return any(key in descriptor for key in ("/FontFile", "/FontFile2", "/FontFile3"))
+
+
+def _has_cmyk_or_gray_group(xobject):
+    """Check if the transparency group of a page or form, if any, is CMYK or gray."""
+    group = xobject.get("/Group")
+    if group is None:
+        return True
+    group = group.get_object()
+    return "/CS" not in group or _cmyk_or_gray_components(group["/CS"]) is not None
+
+
+def _resource_dict(resources, key):
+    """Internal helper: Resource category dict (e.g. /Font), empty if missing."""
+    category = resources.get(key)
+    return category.get_object() if category is not None else {}
+
+
+def _uses_only_cmyk_colors(content, resources, pdf, ctm=(1, 0, 0, 1), depth=0):
+    """
+    Check if a content stream and the resources it draws only use CMYK or gray
+    colors, embedded fonts for its text and images Ghostscript would keep as they are.
+
+    Conservative: anything that cannot be checked cheaply (shadings, patterns,
+    soft masks, Type3 fonts, deeply nested forms) counts as not CMYK.
+
+    :param content: Tokenized content stream (pypdf ContentStream)
+    :param resources: Resource dict of the content stream
+    :param pdf: PdfReader the content stream belongs to
+    :param ctm: Scale part of the CTM at the start of the content stream
+    :param depth: Form XObject nesting depth
+    """
+    if depth > 5:
+        return False
+    resources = resources.get_object() if resources is not None else {}
+    if "/Shading" in resources or "/Pattern" in resources:
+        return False
+    colorspaces = _resource_dict(resources, "/ColorSpace")
+    for colorspace in colorspaces.values():
+        if _cmyk_or_gray_components(colorspace) is None:
+            return False
+    for state in _resource_dict(resources, "/ExtGState").values():
+        if state.get_object().get("/SMask", "/None") != "/None":
+            return False
+    fonts = _resource_dict(resources, "/Font")
+    xobjects = _resource_dict(resources, "/XObject")
+
+    # The CTM and the font are part of the graphics state saved by q
+    font = None
+    saved_states = []
+    for operands, operator in content.operations:
+        if operator == b"q":
+            saved_states.append((ctm, font))
+        elif operator == b"Q":
+            if saved_states:
+                ctm, font = saved_states.pop()
+        elif operator == b"Tf":
+            font = fonts.get(operands[0])
+        elif operator in (b"Tj", b"TJ", b"'", b'"'):
+            # Only fonts that show text are embedded by Ghostscript
+            if font is None or not _is_embedded_font(font):
+                return False
+        elif operator == b"cm":
+            ctm = _multiply_matrix(operands, ctm)
+        elif operator in (b"rg", b"RG"):
+            return False
+        elif operator in (b"cs", b"CS"):
+            if _cmyk_or_gray_components(_resolve_colorspace(operands[0], colorspaces)) is None:
+                return False
+        elif operator == b"INLINE IMAGE":
+            settings = operands["settings"]
+            colorspace = _resolve_colorspace(
+                settings.get("/CS", settings.get("/ColorSpace")), colorspaces
+            )
+            if not _is_print_ready_image(settings, colorspace, ctm):
+                return False
+        elif operator == b"Do":
+            xobject = xobjects.get(operands[0])
+            if xobject is None:
+                return False
+            xobject = xobject.get_object()
+            if xobject.get("/Subtype") == "/Image":
+                if not _is_print_ready_image(xobject, xobject.get("/ColorSpace"), ctm):
+                    return False
+            elif xobject.get("/Subtype") == "/Form":
+                if not _has_cmyk_or_gray_group(xobject) or not _uses_only_cmyk_colors(
+                    ContentStream(xobject, pdf),
+                    # Forms without resources use the resources of the page
+                    xobject.get("/Resources", resources),
+                    pdf,
+                    _multiply_matrix(xobject.get("/Matrix", [1, 0, 0, 1]), ctm),
+                    depth + 1,
+                ):
+                    return False
+            else:
+                return False
+    return True
+
+
+def _pdf_version(reader):
+    """
+    PDF version of a document as a (major, minor) tuple, or None if it cannot be
+    read. The catalog can raise the version given in the header.
+    """
+    versions = []
+    for version in (reader.pdf_header, reader.root_object.get("/Version", "")):
+        match = re.search(r"(\d+)\.(\d+)", str(version))
+        if match:
+            versions.append((int(match.group(1)), int(match.group(2))))
+    return max(versions, default=None)
+
+
+def _is_formatted_for_postcard(input_path, skip_bleed_border=False):
+    """
+    Check if a PDF already matches the output of format_pdf_for_postcard.
+
+    That is every page is landscape at the default postcard size with bleed area
+    (or without it, if skip_bleed_border is set), and the document meets the
+    settings of the Ghostscript CMYK conversion: PDF 1.4, only CMYK or gray
+    colors, embedded fonts and no color images above the downsampling resolution.
+    Neither cropping nor the conversion would then change it.
+
+    :param input_path: Path to input PDF
+    :param skip_bleed_border: skip_bleed_border of format_pdf_for_postcard
+    :return: True if the PDF can be used as is
+    """
+    expected_sizes_mm = [postcardformats.get_default_postcard_size_with_bleeding()]
+    if skip_bleed_border:
+        # Pages at the postcard size get no bleed border, the crop pass keeps them
+        expected_sizes_mm.append(postcardformats.get_default_postcard_size())
+    try:
+        reader = PdfReader(input_path)
+        version = _pdf_version(reader)
+        if not reader.pages or version is None or version > _MAX_PDF_VERSION:
+            return False
+        for page in reader.pages:
+            width_mm, height_mm = get_page_dimensions_in_mm(page)
+            if (
+                not any(
+                    abs(width_mm - target_width_mm) < 0.1
+                    and abs(height_mm - target_height_mm) < 0.1
+                    for target_width_mm, target_height_mm in expected_sizes_mm
+                )
+                or page.get("/Rotate", 0) % 360 != 0
+                or "/Annots" in page
+                # Ghostscript runs with -dUseBleedBox, a smaller bleed box
+                # would crop the page
+                or [float(v) for v in page.bleedbox] != [float(v) for v in page.mediabox]
+                or not _has_cmyk_or_gray_group(page)
+            ):
+                return False
+            contents = page.get_contents()
+            if contents is not None and not _uses_only_cmyk_colors(
+                contents, page.get("/Resources"), reader
+            ):
+                return False
+    except Exception as e:
+        # The preflight is only a shortcut, anything it cannot parse (broken
+        # xref, malformed operators) is formatted as usual
+        print(f"Could not preflight {input_path}, formatting it: {e}")
+        return False
+    return True
+
+
 def format_pdf_for_postcard(input_path, output_path, skip_bleed_border=False):
     """
     Centralized wrapper to format PDF to postcard specifications with default parameters.
-    
+
+    Input that is already formatted (postcard size with bleed, print-ready CMYK
+    PDF 1.4) is copied as is, skipping the crop pass and the Ghostscript conversion.
+
     :param input_path: Path to input PDF
     :param output_path: Path to output PDF
     :param skip_bleed_border: If True, skip adding bleed border (use when frontend already has bleed area)
     """
+    if _is_formatted_for_postcard(input_path, skip_bleed_border):
+        print(f"{input_path} is already formatted for print, skipping formatting")
+        shutil.copyfile(input_path, output_path)
+        return
+
+    target_width_mm, target_height_mm = postcardformats.get_default_postcard_size()
+    (
+        target_width_mm_with_bleeding,
+        target_height_mm_with_bleeding,
+    ) = postcardformats.get_default_postcard_size_with_bleeding()
     process_pdf_for_print(
         input_path=input_path,
         output_path=output_path,
-        target_width_mm=postcardformats.get_default_postcard_size()[0],
-        target_height_mm=postcardformats.get_default_postcard_size()[1],
-        target_width_mm_with_bleeding=postcardformats.get_default_postcard_size_with_bleeding()[0],
-        target_height_mm_with_bleeding=postcardformats.get_default_postcard_size_with_bleeding()[1],
+        target_width_mm=target_width_mm,
+        target_height_mm=target_height_mm,
+        target_width_mm_with_bleeding=target_width_mm_with_bleeding,
+        target_height_mm_with_bleeding=target_height_mm_with_bleeding,
         skip_bleed_border=skip_bleed_border,
         #enable_rotation=False,
     )
@@ -52,18 +346,19 @@ def process_postcard(input_pdf, printversion_pdf, preview_version_pdf, skip_blee
 
             traceback.print_exc()
 
+    cut_edge_x_mm, cut_edge_y_mm = postcardformats.get_default_cutting_size()
     draw_cutting_area(
         pdf_input=printversion_pdf,
         pdf_output=preview_version_pdf,
-        cut_edge_x_mm=postcardformats.get_default_cutting_size()[0],
-        cut_edge_y_mm=postcardformats.get_default_cutting_size()[1],
+        cut_edge_x_mm=cut_edge_x_mm,
+        cut_edge_y_mm=cut_edge_y_mm,
         tolerances_mm=3,
     )
     add_crop_marks_to_pdf(
         input_pdf_path=printversion_pdf,
         output_pdf_path=printversion_pdf,
-        bleed_area_width_mm=postcardformats.get_default_cutting_size()[0],
-        bleed_area_height_mm=postcardformats.get_default_cutting_size()[1],
+        bleed_area_width_mm=cut_edge_x_mm,
+        bleed_area_height_mm=cut_edge_y_mm,
     )
 
 
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the preflight that lets print-ready PDFs skip format_pdf_for_postcard
+"""
+
+import os
+import tempfile
+
+from pypdf import PdfWriter
+from pypdf.generic import (
+    ContentStream,
+    DecodedStreamObject,
+    DictionaryObject,
+    FloatObject,
+    NameObject,
+)
+
+import postcardformats
+from postprocessor import _is_formatted_for_postcard
+
+
+def _write_pdf(path, content, resources=None, size_mm=None):
+    """Write a one-page PDF with the given content stream and resources"""
+    width_mm, height_mm = size_mm or postcardformats.get_default_postcard_size_with_bleeding()
+    writer = PdfWriter()
+    page = writer.add_blank_page(width_mm * 72 / 25.4, height_mm * 72 / 25.4)
+    stream = DecodedStreamObject()
+    stream.set_data(content)
+    page.replace_contents(ContentStream(stream, writer))
+    page[NameObject("/Resources")] = resources or DictionaryObject()
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def _is_formatted(content, resources=None, size_mm=None, skip_bleed_border=False):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "input.pdf")
+        _write_pdf(path, content, resources, size_mm)
+        return _is_formatted_for_postcard(path, skip_bleed_border)
+
+
+def test_cmyk_pdf_is_formatted():
+    """CMYK and gray colors at the postcard size with bleed take the fast path"""
+    assert _is_formatted(
+        b"0 0 0 1 k 0 0 10 10 re f 0.5 G 0 0 m 10 10 l S /DeviceCMYK cs 0 1 0 0 sc 0 0 5 5 re f"
+    )
+
+
+def test_rgb_cs_sc_pdf_is_not_formatted():
+    """RGB colors set with cs/sc or CS/SCN must be converted"""
+    assert not _is_formatted(b"/DeviceRGB cs 1 0 0 sc 0 0 10 10 re f")
+    assert not _is_formatted(b"/DeviceRGB CS 0 1 0 SCN 0 0 m 10 10 l S")
+
+
+def test_rgb_rg_before_delimiter_is_not_formatted():
+    """An rg operator directly followed by a name must still be found"""
+    resources = DictionaryObject(
+        {
+            NameObject("/ExtGState"): DictionaryObject(
+                {NameObject("/GS1"): DictionaryObject({NameObject("/CA"): FloatObject(1)})}
+            )
+        }
+    )
+    assert not _is_formatted(b"1 0 0 rg/GS1 gs 0 0 10 10 re f", resources)
+    assert not _is_formatted(b"0 0 1 RG/GS1 gs 0 0 m 10 10 l S", resources)
+
+
+def test_rgb_page_group_is_not_formatted():
+    """A transparency group in RGB is blended in RGB and must be converted"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "input.pdf")
+        _write_pdf(path, b"0 0 0 1 k 0 0 10 10 re f")
+        writer = PdfWriter(clone_from=path)
+        writer.pages[0][NameObject("/Group")] = DictionaryObject(
+            {
+                NameObject("/S"): NameObject("/Transparency"),
+                NameObject("/CS"): NameObject("/DeviceRGB"),
+            }
+        )
+        with open(path, "wb") as f:
+            writer.write(f)
+        assert not _is_formatted_for_postcard(path)
+
+
+def test_postcard_size_without_bleed():
+    """Pages without bleed area only take the fast path when no bleed border is added"""
+    size_mm = postcardformats.get_default_postcard_size()
+    content = b"0 0 0 1 k 0 0 10 10 re f"
+    assert not _is_formatted(content, size_mm=size_mm)
+    assert _is_formatted(content, size_mm=size_mm, skip_bleed_border=True)
+
+
+def test_malformed_operator_is_not_formatted():
+    """Content the preflight cannot check goes through the normal formatting"""
+    assert not _is_formatted(b"q 1 0 cm 0 0 0 1 k 0 0 10 10 re f Q")
+    assert not _is_formatted(b"Tf 0 0 0 1 k 0 0 10 10 re f")
+
+
+if __name__ == "__main__":
+    test_cmyk_pdf_is_formatted()
+    test_rgb_cs_sc_pdf_is_not_formatted()
+    test_rgb_rg_before_delimiter_is_not_formatted()
+    test_rgb_page_group_is_not_formatted()
+    test_postcard_size_without_bleed()
+    test_malformed_operator_is_not_formatted()
+    print("All postprocessor tests passed")
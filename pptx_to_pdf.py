@@ -2,51 +2,85 @@ import comtypes.client
 import comtypes
 import os
 
+PP_FORMAT_PDF = 32  # https://learn.microsoft.com/en-us/office/vba/api/powerpoint.ppsaveasfiletype
 
-def ppt_to_pdf(input_file, output_file):
+
+class PPTConverter:
     """
-    Convert PowerPoint file to PDF using COM automation.
+    Convert PowerPoint files to PDF, reusing one PowerPoint application.
 
-    Args:
-        input_file (str): Path to the input PowerPoint file
-        output_file (str): Path to the output PDF file
+    Starting PowerPoint takes seconds, so convert many files within one context:
+
+        with PPTConverter() as converter:
+            for input_file, output_file in files:
+                converter.convert(input_file, output_file)
     """
-    # Initialize COM
-    comtypes.CoInitialize()
 
-    try:
-        PP_FORMAT_PDF = 32  # https://learn.microsoft.com/en-us/office/vba/api/powerpoint.ppsaveasfiletype
+    def __init__(self, quit_on_exit=True):
+        """
+        Args:
+            quit_on_exit (bool): Quit PowerPoint when leaving the context
+        """
+        self.quit_on_exit = quit_on_exit
+        self.powerpoint = None
 
+    def __enter__(self):
+        # Initialize COM
+        comtypes.CoInitialize()
+        try:
+            # Create PowerPoint application
+            self.powerpoint = comtypes.client.CreateObject("Powerpoint.Application")
+            self.powerpoint.Visible = 1  # Keep PowerPoint hidden for server use
+        except Exception:
+            comtypes.CoUninitialize()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            # If a conversion failed, try to quit gracefully
+            if self.quit_on_exit or exc_type is not None:
+                try:
+                    self.powerpoint.Quit()
+                except:
+                    pass
+        finally:
+            self.powerpoint = None
+            # Always uninitialize COM
+            comtypes.CoUninitialize()
+
+    def convert(self, input_file, output_file):
+        """
+        Convert one PowerPoint file to PDF.
+
+        Args:
+            input_file (str): Path to the input PowerPoint file
+            output_file (str): Path to the output PDF file
+        """
         # Ensure paths are absolute
         input_file = os.path.abspath(input_file)
         output_file = os.path.abspath(output_file)
 
-        # Create PowerPoint application
-        powerpoint = comtypes.client.CreateObject("Powerpoint.Application")
-        powerpoint.Visible = 1  # Keep PowerPoint hidden for server use
-
+        # Open presentation
+        presentation = self.powerpoint.Presentations.Open(input_file)
         try:
-            # Open presentation
-            presentation = powerpoint.Presentations.Open(input_file)
-
             # Save as PDF
             presentation.SaveAs(output_file, PP_FORMAT_PDF)
-
+        finally:
             # Close presentation
             presentation.Close()
 
-        except Exception as e:
-            # If PowerPoint is open, try to quit gracefully
-            try:
-                if "powerpoint" in locals():
-                    powerpoint.Quit()
-            except:
-                pass
-            raise e
-
-        # Quit PowerPoint
-        # powerpoint.Quit()
-
-    finally:
-        # Always uninitialize COM
-        comtypes.CoUninitialize()
+
+def ppt_to_pdf(input_file, output_file):
+    """
+    Convert PowerPoint file to PDF using COM automation.
+
+    Use PPTConverter to convert several files with one PowerPoint instance.
+
+    Args:
+        input_file (str): Path to the input PowerPoint file
+        output_file (str): Path to the output PDF file
+    """
+    # PowerPoint is left running, later calls attach to it instead of starting it again
+    with PPTConverter(quit_on_exit=False) as converter:
+        converter.convert(input_file, output_file)
@@ -1,15 +1,17 @@
-from pypdf import PdfReader, PdfWriter
+import fitz  # PyMuPDF
+from pypdf import PdfReader
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
 import io
 
 
-def generate_crop_marks_pdf(
+def _crop_mark_lines(
     page_width, page_height, bleed_area_width_mm, bleed_area_height_mm, mark_distance_mm
 ):
     """
-    Generate crop marks that start from the edge of the PDF and extend inward by bleed_area distance.
-    The marks stop mark_distance_mm before reaching the content area.
+    Internal helper: Coordinates of the crop mark lines of a page.
+
+    :return: List of (x1, y1, x2, y2) tuples in points, origin at the bottom left
     """
     # Convert bleed area to points
     bleed_area_width_pt = bleed_area_width_mm * mm
@@ -19,75 +21,85 @@ def generate_crop_marks_pdf(
     mark_length_x = (bleed_area_width_mm - mark_distance_mm) * mm
     mark_length_y = (bleed_area_height_mm - mark_distance_mm) * mm
 
+    return [
+        # Top-left corner - marks start from edge (0, page_height) and extend inward
+        (
+            bleed_area_width_pt,
+            page_height,
+            bleed_area_width_pt,
+            page_height - mark_length_y,
+        ),  # vertical down from top edge
+        (
+            0,
+            page_height - bleed_area_height_pt,
+            mark_length_x,
+            page_height - bleed_area_height_pt,
+        ),  # horizontal right from left edge
+        # Bottom-left corner - marks start from edge (0,0) and extend inward
+        (
+            bleed_area_width_pt,
+            0,
+            bleed_area_width_pt,
+            mark_length_y,
+        ),  # vertical up from bottom edge
+        (
+            0,
+            bleed_area_height_pt,
+            mark_length_x,
+            bleed_area_height_pt,
+        ),  # horizontal right from left edge
+        # Bottom-right corner - marks start from edge (page_width, 0) and extend inward
+        (
+            page_width - bleed_area_width_pt,
+            0,
+            page_width - bleed_area_width_pt,
+            mark_length_y,
+        ),  # vertical up from bottom edge
+        (
+            page_width,
+            bleed_area_height_pt,
+            page_width - mark_length_x,
+            bleed_area_height_pt,
+        ),  # horizontal left from right edge
+        # Top-right corner - marks start from edge (page_width, page_height) and extend inward
+        (
+            page_width - bleed_area_width_pt,
+            page_height,
+            page_width - bleed_area_width_pt,
+            page_height - mark_length_y,
+        ),  # vertical down from top edge
+        (
+            page_width,
+            page_height - bleed_area_height_pt,
+            page_width - mark_length_x,
+            page_height - bleed_area_height_pt,
+        ),  # horizontal left from right edge
+    ]
+
+
+def generate_crop_marks_pdf(
+    page_width, page_height, bleed_area_width_mm, bleed_area_height_mm, mark_distance_mm
+):
+    """
+    Generate crop marks that start from the edge of the PDF and extend inward by bleed_area distance.
+    The marks stop mark_distance_mm before reaching the content area.
+    """
     packet = io.BytesIO()
     c = canvas.Canvas(packet, pagesize=(page_width, page_height))
 
-    def draw_crop_mark_line(x1, y1, x2, y2):
-        """Draw a crop mark line with white background and black foreground."""
-        # White line (background)
-        c.setStrokeColorRGB(1, 1, 1)
-        c.setLineWidth(0.6 * 3)
-        c.line(x1, y1, x2, y2)
-        # Black line (foreground)
-        c.setStrokeColorRGB(0, 0, 0)
-        c.setLineWidth(0.6)
-        c.line(x1, y1, x2, y2)
-
-    # Top-left corner - marks start from edge (0, page_height) and extend inward
-    draw_crop_mark_line(
-        bleed_area_width_pt,
-        page_height,
-        bleed_area_width_pt,
-        page_height - mark_length_y,
-    )  # vertical down from top edge
-    draw_crop_mark_line(
-        0,
-        page_height - bleed_area_height_pt,
-        mark_length_x,
-        page_height - bleed_area_height_pt,
-    )  # horizontal right from left edge
-
-    # Bottom-left corner - marks start from edge (0,0) and extend inward
-    draw_crop_mark_line(
-        bleed_area_width_pt,
-        0,
-        bleed_area_width_pt,
-        mark_length_y,
-    )  # vertical up from bottom edge
-    draw_crop_mark_line(
-        0,
-        bleed_area_height_pt,
-        mark_length_x,
-        bleed_area_height_pt,
-    )  # horizontal right from left edge
-
-    # Bottom-right corner - marks start from edge (page_width, 0) and extend inward
-    draw_crop_mark_line(
-        page_width - bleed_area_width_pt,
-        0,
-        page_width - bleed_area_width_pt,
-        mark_length_y,
-    )  # vertical up from bottom edge
-    draw_crop_mark_line(
-        page_width,
-        bleed_area_height_pt,
-        page_width - mark_length_x,
-        bleed_area_height_pt,
-    )  # horizontal left from right edge
-
-    # Top-right corner - marks start from edge (page_width, page_height) and extend inward
-    draw_crop_mark_line(
-        page_width - bleed_area_width_pt,
-        page_height,
-        page_width - bleed_area_width_pt,
-        page_height - mark_length_y,
-    )  # vertical down from top edge
-    draw_crop_mark_line(
-        page_width,
-        page_height - bleed_area_height_pt,
-        page_width - mark_length_x,
-        page_height - bleed_area_height_pt,
-    )  # horizontal left from right edge
+    # All marks are stroked together, twice. The marks do not overlap, so this
+    # looks the same as stroking every line white and then black
+    lines = _crop_mark_lines(
+        page_width, page_height, bleed_area_width_mm, bleed_area_height_mm, mark_distance_mm
+    )
+    # White lines (background)
+    c.setStrokeColorRGB(1, 1, 1)
+    c.setLineWidth(0.6 * 3)
+    c.lines(lines)
+    # Black lines (foreground)
+    c.setStrokeColorRGB(0, 0, 0)
+    c.setLineWidth(0.6)
+    c.lines(lines)
 
     c.save()
     packet.seek(0)
@@ -95,6 +107,43 @@ def generate_crop_marks_pdf(
     return reader.pages[0]
 
 
+def _crop_marks_content(lines):
+    """
+    Internal helper: Content stream drawing crop mark lines after the page content.
+
+    Starts by restoring the graphics state saved before the page content, so the
+    marks are drawn in the default user space whatever the content left behind.
+
+    :param lines: List of (x1, y1, x2, y2) tuples in points
+    :return: Content stream data as bytes
+    """
+    # All marks in one path, stroked white (background) and then black
+    # (foreground), like generate_crop_marks_pdf
+    path = " ".join(
+        f"{x1:.4f} {y1:.4f} m {x2:.4f} {y2:.4f} l" for x1, y1, x2, y2 in lines
+    )
+    operations = [
+        "Q",
+        "q",
+        f"1 1 1 RG {0.6 * 3:g} w {path} S",
+        f"0 0 0 RG 0.6 w {path} S",
+        "Q",
+    ]
+    return ("\n".join(operations) + "\n").encode("ascii")
+
+
+def _add_content_stream(doc, data):
+    """
+    Internal helper: Add a compressed stream object to a PyMuPDF document.
+
+    :return: xref number of the new stream
+    """
+    xref = doc.get_new_xref()
+    doc.update_object(xref, "<<>>")
+    doc.update_stream(xref, data)
+    return xref
+
+
 def add_crop_marks_to_pdf(
     input_pdf_path,
     output_pdf_path=None,
@@ -111,33 +160,52 @@ def add_crop_marks_to_pdf(
     if bleed_area_height_mm is None:
         bleed_area_height_mm = bleed_area_width_mm
 
-    reader = PdfReader(input_pdf_path)
-    writer = PdfWriter()
-    num_pages = len(reader.pages)
-    for i in range(num_pages):
-        if (page_numbers is not None) and (i + 1 not in page_numbers):
-            writer.add_page(reader.pages[i])
+    # Read the whole file at once instead of letting MuPDF seek and read
+    # it piece by piece while parsing
+    with open(input_pdf_path, "rb") as f:
+        doc = fitz.open("pdf", f.read())
+    # Content streams shared by all pages: one that saves the graphics state
+    # before the page content, and one per page size that restores it and
+    # draws the crop marks
+    save_state_xref = None
+    crop_marks_xrefs = {}
+    for page_num, page in enumerate(doc):
+        if (page_numbers is not None) and (page_num + 1 not in page_numbers):
             continue
 
-        page = reader.pages[i]
-        width = float(page.mediabox.width)
-        height = float(page.mediabox.height)
-
-        # Get crop mark page for this page size
-        crop_marks_page = generate_crop_marks_pdf(
-            width,
-            height,
-            bleed_area_width_mm,
-            bleed_area_height_mm,
-            mark_distance_mm,
+        # Append the marks as an extra content stream instead of merging a
+        # separately rendered crop mark page. The lines are in PDF user space,
+        # just like the page content they are drawn after.
+        width = page.mediabox.width
+        height = page.mediabox.height
+        crop_marks_xref = crop_marks_xrefs.get((width, height))
+        if crop_marks_xref is None:
+            crop_marks_xref = _add_content_stream(
+                doc,
+                _crop_marks_content(
+                    _crop_mark_lines(
+                        width,
+                        height,
+                        bleed_area_width_mm,
+                        bleed_area_height_mm,
+                        mark_distance_mm,
+                    )
+                ),
+            )
+            crop_marks_xrefs[(width, height)] = crop_marks_xref
+        if save_state_xref is None:
+            save_state_xref = _add_content_stream(doc, b"q\n")
+
+        contents = [save_state_xref, *page.get_contents(), crop_marks_xref]
+        doc.xref_set_key(
+            page.xref, "Contents", "[" + " ".join(f"{xref} 0 R" for xref in contents) + "]"
         )
 
-        # Merge crop marks onto the page
-        page.merge_page(crop_marks_page)
-        writer.add_page(page)
-
+    # The output may be the input file, so serialize and close the input first
+    pdf_data = doc.tobytes(garbage=1, deflate=True)
+    doc.close()
     with open(output_pdf_path, "wb") as f:
-        writer.write(f)
+        f.write(pdf_data)
 
 
 if __name__ == "__main__":
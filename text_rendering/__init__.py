@@ -3,7 +3,7 @@ Text rendering utilities package.
 Modular components for postcard text side generation.
 """
 
-from .emoji_handler import set_emoji_cache_dir, precache_emojis_in_text, get_emoji_image_path
+from .emoji_handler import set_emoji_cache_dir, precache_emojis_in_text, prewarm_emoji_cache, get_emoji_image_path
 from .language_support import contains_arabic, contains_cjk, get_font_for_text, process_arabic_text
 from .text_processing import get_color_rgb, has_special_rendering_needs, prepare_text_with_language_fonts
 from .text_fitting import (
@@ -21,6 +21,7 @@ __all__ = [
     # Emoji handling
     'set_emoji_cache_dir',
     'precache_emojis_in_text',
+    'prewarm_emoji_cache',
     'get_emoji_image_path',
     # Language support
     'contains_arabic',
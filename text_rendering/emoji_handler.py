@@ -3,11 +3,17 @@ Emoji handling utilities for postcard generation.
 Provides emoji detection, image downloading, and replacement functionality.
 """
 
-import emoji
+import json
 import os
-import urllib.request
-import urllib.error
+import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,9 +23,65 @@ EMOJI_CACHE_DIR = None  # Will be set dynamically
 # In-memory cache of emoji characters that previously failed to download
 _FAILED_EMOJI_DOWNLOADS = set()
 
+# Emoji characters the CDN does not have (404 for every candidate). Unlike network
+# errors these failures are permanent, so they are stored in _FAILED_DOWNLOADS_FILE
+# in the cache directory and not requested again by later runs
+_MISSING_EMOJI = set()
+_FAILED_DOWNLOADS_FILE = "_failed.json"
+_FAILED_DOWNLOADS_LOCK = threading.Lock()
+
+# Cache directory whose stored failures have been loaded
+_LOADED_CACHE_DIR = None
+
+# Images in the cache directory by codepoint file name (without ".png"), from
+# one directory scan, so lookups need no file system check per emoji
+_DISK_CODEPOINT_INDEX = {}
+
 # In-memory cache of successfully downloaded emoji paths to avoid repeated file system checks
 _EMOJI_PATH_CACHE = {}
 
+# Maximum number of emoji images downloaded at the same time when pre-caching
+_EMOJI_DOWNLOAD_WORKERS = 16
+
+# Seconds to wait for the CDN to connect or send data
+_DOWNLOAD_TIMEOUT = 5
+
+# Stands in for the size in emoji <img> tags when text is prepared once for
+# several font sizes, see replace_emojis_with_images
+EMOJI_SIZE_PLACEHOLDER = "\x00emoji_size\x00"
+
+
+def _new_session():
+    """
+    Create the HTTP session used for emoji downloads.
+
+    All emoji images come from one CDN, so the session keeps the connections (and
+    their TLS handshakes) alive, one per download thread.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=_EMOJI_DOWNLOAD_WORKERS,
+            max_retries=Retry(
+                total=2, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+            ),
+        ),
+    )
+    return session
+
+
+def _reset_session():
+    """Replace the HTTP session, so a forked process does not share the parent's connections."""
+    global _SESSION
+    _SESSION = _new_session()
+
+
+_SESSION = _new_session()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_session)
+
 
 def _strip_variation_selectors(s):
     """
@@ -39,8 +101,99 @@ def set_emoji_cache_dir(cache_dir):
     """
     global EMOJI_CACHE_DIR
     EMOJI_CACHE_DIR = cache_dir
-    if cache_dir and not os.path.exists(cache_dir):
+    if cache_dir:
+        _get_cache_dir()
+
+
+def _get_cache_dir():
+    """
+    Internal helper: The emoji cache directory, created, scanned and with its
+    stored failures loaded on first use.
+    """
+    global _LOADED_CACHE_DIR
+    # Use cache directory or temp
+    cache_dir = EMOJI_CACHE_DIR or os.path.join(
+        os.path.dirname(__file__), ".emoji_cache"
+    )
+    if cache_dir != _LOADED_CACHE_DIR:
         os.makedirs(cache_dir, exist_ok=True)
+        _load_failed_downloads(cache_dir)
+        _scan_cache_dir(cache_dir)
+        _LOADED_CACHE_DIR = cache_dir
+    return cache_dir
+
+
+def _scan_cache_dir(cache_dir):
+    """Internal helper: Index the emoji images in a cache directory."""
+    with os.scandir(cache_dir) as entries:
+        index = {
+            entry.name[:-4]: entry.path
+            for entry in entries
+            if entry.name.endswith(".png")
+        }
+    _DISK_CODEPOINT_INDEX.clear()
+    _DISK_CODEPOINT_INDEX.update(index)
+
+
+def _load_failed_downloads(cache_dir):
+    """Internal helper: Load the emoji stored as missing in a cache directory."""
+    try:
+        with open(os.path.join(cache_dir, _FAILED_DOWNLOADS_FILE), encoding="utf-8") as f:
+            missing = json.load(f)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        _LOGGER.warning("Could not read the failed emoji downloads: %s", e)
+        return
+    with _FAILED_DOWNLOADS_LOCK:
+        _MISSING_EMOJI.update(missing)
+        _FAILED_EMOJI_DOWNLOADS.update(missing)
+
+
+def _store_missing_emoji(cache_dir, emoji_char):
+    """
+    Internal helper: Record an emoji the CDN does not have in the cache directory.
+
+    The file is merged with what other processes stored and replaced atomically,
+    so a reader never sees a partly written file.
+    """
+    path = os.path.join(cache_dir, _FAILED_DOWNLOADS_FILE)
+    with _FAILED_DOWNLOADS_LOCK:
+        _MISSING_EMOJI.add(emoji_char)
+        try:
+            with open(path, encoding="utf-8") as f:
+                _MISSING_EMOJI.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(sorted(_MISSING_EMOJI), f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            _LOGGER.warning("Could not store the failed emoji downloads: %s", e)
+
+
+def _write_cache_file(cache_path, data):
+    """
+    Internal helper: Write a downloaded image into the cache directory.
+
+    The image is written to a temporary file and renamed, so an interrupted
+    write never leaves a broken image that later runs would take as cached.
+    """
+    if not data:
+        raise ValueError("empty response")
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
 
 
 def get_emoji_image_path(emoji_char, size=32):
@@ -56,16 +209,11 @@ def get_emoji_image_path(emoji_char, size=32):
     if emoji_char in _EMOJI_PATH_CACHE:
         return _EMOJI_PATH_CACHE[emoji_char]
 
-    # Use cache directory or temp
-    cache_dir = EMOJI_CACHE_DIR or os.path.join(
-        os.path.dirname(__file__), ".emoji_cache"
-    )
-    if not os.path.exists(cache_dir):
-        os.makedirs(cache_dir, exist_ok=True)
+    cache_dir = _get_cache_dir()
 
     # Avoid retrying downloads for emoji we've already seen fail during this
-    # process - this reduces repeated 404 warnings (user reported repeated
-    # messages for emojis like ❤️).
+    # process or that earlier runs found missing - this reduces repeated 404
+    # warnings (user reported repeated messages for emojis like ❤️).
     if emoji_char in _FAILED_EMOJI_DOWNLOADS:
         return None
 
@@ -83,24 +231,28 @@ def get_emoji_image_path(emoji_char, size=32):
         codepoint = "-".join([f"{ord(c):x}" for c in candidate])
 
         # Check cache before attempting download
-        cache_path = os.path.join(cache_dir, f"{codepoint}.png")
-        if os.path.exists(cache_path):
+        cache_path = _DISK_CODEPOINT_INDEX.get(codepoint)
+        if cache_path is not None:
             # Store in memory cache for faster future lookups
             _EMOJI_PATH_CACHE[emoji_char] = cache_path
             return cache_path
+        cache_path = os.path.join(cache_dir, f"{codepoint}.png")
 
         # Attempt to download from Twemoji CDN
         url = f"https://cdn.jsdelivr.net/gh/twitter/twemoji@14.0.2/assets/72x72/{codepoint}.png"
         try:
-            urllib.request.urlretrieve(url, cache_path)
+            response = _SESSION.get(url, timeout=_DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            _write_cache_file(cache_path, response.content)
             # Store successful download in memory cache
+            _DISK_CODEPOINT_INDEX[codepoint] = cache_path
             _EMOJI_PATH_CACHE[emoji_char] = cache_path
             return cache_path
-        except urllib.error.HTTPError as e:
+        except requests.HTTPError as e:
             # If Twemoji doesn't have that exact filename we'll often get a
             # 404. Try next candidate instead of immediately failing.
             last_error = e
-            if e.code == 404:
+            if e.response.status_code == 404:
                 _LOGGER.debug(
                     "Twemoji 404 for %s (candidate %s), trying next candidate",
                     emoji_char,
@@ -122,6 +274,12 @@ def get_emoji_image_path(emoji_char, size=32):
     # If we reach here we couldn't download any candidate. Record failure to
     # avoid repeated attempts during the same run and emit a single warning.
     _FAILED_EMOJI_DOWNLOADS.add(emoji_char)
+    if (
+        isinstance(last_error, requests.HTTPError)
+        and last_error.response.status_code == 404
+    ):
+        # The CDN does not have this emoji, later runs need not ask again
+        _store_missing_emoji(cache_dir, emoji_char)
     if last_error is not None:
         _LOGGER.warning(
             "Could not download emoji image for %s: %s", emoji_char, last_error
@@ -133,55 +291,127 @@ def get_emoji_image_path(emoji_char, size=32):
     return None
 
 
+# Every emoji contains at least one character from U+00A9 (©, the lowest one) up,
+# so texts without such characters need no scan by the emoji library
+_EMOJI_CANDIDATE_PATTERN = re.compile(r"[^\x00-\xa8]")
+
+
+@lru_cache(maxsize=64)
+def find_emojis(text):
+    """
+    Find the emojis in a text, like emoji.emoji_list but cached.
+
+    Rendering one message scans it several times (rendering needs, emoji density,
+    pre-caching and replacement), so the result is kept for recent texts.
+
+    :param text: Text to scan
+    :return: Tuple of (emoji, match_start, match_end) tuples
+    """
+    if _EMOJI_CANDIDATE_PATTERN.search(text) is None:
+        return ()
+
+    # Imported on first use, loading its emoji tables takes a while
+    import emoji
+
+    return tuple(
+        (item["emoji"], item["match_start"], item["match_end"])
+        for item in emoji.emoji_list(text)
+    )
+
+
+def get_emoji_size(font_size):
+    """Size of emoji images for a font size (slightly larger for visibility)."""
+    return int(font_size * 1.2)
+
+
+def fill_emoji_size(text, font_size):
+    """
+    Fill in the emoji size of text prepared with replace_emojis_with_images(text, None).
+
+    :param text: Text with EMOJI_SIZE_PLACEHOLDER in its <img> tags
+    :param font_size: Font size to match emoji size
+    :return: Text with the emoji size filled in
+    """
+    return text.replace(EMOJI_SIZE_PLACEHOLDER, str(get_emoji_size(font_size)))
+
+
 def replace_emojis_with_images(text, font_size):
     """
     Replace emoji characters in text with HTML img tags for colored emoji rendering.
     Note: This function should be called BEFORE processing Arabic text with bidi algorithm.
 
     :param text: Text containing emojis
-    :param font_size: Font size to match emoji size
+    :param font_size: Font size to match emoji size, or None to leave
+        EMOJI_SIZE_PLACEHOLDER as the size, to be filled in later by fill_emoji_size
     :return: Text with emojis replaced by <img> tags
     """
     # Get all emojis in the text using the emoji library
-    # emoji.emoji_list() returns list of dicts with 'emoji', 'match_start', 'match_end'
-    emoji_data = emoji.emoji_list(text)
+    emoji_data = find_emojis(text)
 
     if not emoji_data:
         return text
 
-    # Process from end to start to avoid position shifts
-    result = text
-    for item in reversed(emoji_data):
-        emoji_char = item["emoji"]
-        start = item["match_start"]
-        end = item["match_end"]
+    if font_size is None:
+        emoji_size = EMOJI_SIZE_PLACEHOLDER
+    else:
+        emoji_size = get_emoji_size(font_size)
 
+    # Collect the text between emojis and their replacements from start to end
+    # and join them once, instead of slicing the whole text for every emoji
+    parts = []
+    position = 0
+    for emoji_char, start, end in emoji_data:
         # Check if there's a variation selector (U+FE0F) immediately after the emoji
         # and extend the end position to include it
         actual_end = end
-        if actual_end < len(result) and ord(result[actual_end]) == 0xFE0F:
+        if actual_end < len(text) and ord(text[actual_end]) == 0xFE0F:
             actual_end += 1
 
         img_path = get_emoji_image_path(emoji_char)
 
         if img_path:
-            # Use file:// URL for local images
-            # ReportLab Paragraph needs proper file URI
+            # Pass the plain file path: ReportLab opens it directly, while file://
+            # URLs go through its URL opener, which rejects them unless
+            # rl_config.trustedHosts is configured
             img_uri = img_path.replace("\\", "/")
-            if not img_uri.startswith("file:///"):
-                img_uri = "file:///" + img_uri
 
-            # Size emoji to match font size (slightly larger for visibility)
-            emoji_size = int(font_size * 1.2)
             replacement = f'<img src="{img_uri}" width="{emoji_size}" height="{emoji_size}" valign="middle"/>'
         else:
             # Fallback to the emoji character itself (will render as monochrome)
             replacement = emoji_char
 
         # Replace this emoji occurrence (including any trailing variation selector)
-        result = result[:start] + replacement + result[actual_end:]
+        parts.append(text[position:start])
+        parts.append(replacement)
+        position = actual_end
 
-    return result
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def _precache_emojis(emoji_chars):
+    """
+    Internal helper: Resolve the images of several emoji, downloading missing ones in parallel.
+
+    Downloads are network bound, so they run in threads. Every emoji is resolved by
+    exactly one thread, which is the only one touching its cache entries.
+
+    :param emoji_chars: Set of emoji characters
+    """
+    uncached = [
+        emoji_char
+        for emoji_char in emoji_chars
+        if emoji_char not in _EMOJI_PATH_CACHE and emoji_char not in _FAILED_EMOJI_DOWNLOADS
+    ]
+    if len(uncached) <= 1:
+        for emoji_char in uncached:
+            get_emoji_image_path(emoji_char)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(_EMOJI_DOWNLOAD_WORKERS, len(uncached))
+    ) as executor:
+        list(executor.map(get_emoji_image_path, uncached))
 
 
 def precache_emojis_in_text(text):
@@ -190,6 +420,22 @@ def precache_emojis_in_text(text):
     
     :param text: Text to scan for emojis
     """
-    emoji_list = emoji.emoji_list(text)
-    for emoji_item in emoji_list:
-        get_emoji_image_path(emoji_item["emoji"])
+    _precache_emojis({emoji_char for emoji_char, _, _ in find_emojis(text)})
+
+
+def prewarm_emoji_cache(texts):
+    """
+    Pre-cache the emoji images of many texts at once (e.g. all messages of a batch).
+
+    Scans all texts in a single pass and resolves every unique emoji once, so later
+    rendering only hits the in-memory path cache.
+
+    :param texts: Iterable of texts to scan for emojis
+    """
+    text = "\n".join(texts)
+    if _EMOJI_CANDIDATE_PATTERN.search(text) is None:
+        return
+
+    import emoji
+
+    _precache_emojis({item["emoji"] for item in emoji.emoji_list(text)})
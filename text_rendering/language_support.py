@@ -5,6 +5,8 @@ Handles Arabic, CJK (Chinese, Japanese, Korean), and other special character set
 
 import re
 import logging
+from functools import lru_cache
+from importlib.util import find_spec
 import sys
 import os
 
@@ -12,13 +14,11 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from font_manager import get_arabic_font, get_cjk_font
 
-# Arabic text support
-try:
-    import arabic_reshaper
-    from bidi.algorithm import get_display
-    ARABIC_SUPPORT = True
-except ImportError:
-    ARABIC_SUPPORT = False
+# Arabic text support. The packages are only imported by process_arabic_text,
+# so messages without Arabic text do not pay for loading them
+ARABIC_SUPPORT = (
+    find_spec("arabic_reshaper") is not None and find_spec("bidi") is not None
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,46 +29,62 @@ if not ARABIC_SUPPORT:
     )
 
 
+# Arabic Unicode ranges:
+# U+0600-U+06FF: Arabic
+# U+0750-U+077F: Arabic Supplement
+# U+08A0-U+08FF: Arabic Extended-A
+# U+FB50-U+FDFF: Arabic Presentation Forms-A
+# U+FE70-U+FEFF: Arabic Presentation Forms-B
+_ARABIC_CHARS = r"[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]"
+_ARABIC_PATTERN = re.compile(_ARABIC_CHARS)
+
+# CJK Unicode ranges:
+# U+4E00-U+9FFF: CJK Unified Ideographs (Chinese, Japanese, Korean)
+# U+3400-U+4DBF: CJK Unified Ideographs Extension A
+# U+20000-U+2A6DF: CJK Unified Ideographs Extension B
+# U+2A700-U+2B73F: CJK Unified Ideographs Extension C
+# U+2B740-U+2B81F: CJK Unified Ideographs Extension D
+# U+3040-U+309F: Hiragana (Japanese)
+# U+30A0-U+30FF: Katakana (Japanese)
+# U+AC00-U+D7AF: Hangul Syllables (Korean)
+# U+1100-U+11FF: Hangul Jamo (Korean)
+_CJK_CHARS = r"[\u4E00-\u9FFF\u3400-\u4DBF\u3040-\u309F\u30A0-\u30FF\uAC00-\uD7AF\u1100-\u11FF]"
+_CJK_PATTERN = re.compile(_CJK_CHARS)
+
+# Runs of Arabic and/or CJK characters for wrap_special_text_with_fonts, by which
+# scripts get a font. The whole run is the only group, so re.split returns each
+# run once, at the odd indices
+_SPECIAL_RUN_PATTERNS = {
+    (True, True): re.compile(f"({_ARABIC_CHARS}+|{_CJK_CHARS}+)"),
+    (True, False): re.compile(f"({_ARABIC_CHARS}+)"),
+    (False, True): re.compile(f"({_CJK_CHARS}+)"),
+}
+
+
+@lru_cache(maxsize=4096)
 def contains_arabic(text):
     """
     Check if text contains Arabic characters.
 
+    Cached, as the same lines are checked again for every font size tried.
+
     :param text: Text to check
     :return: True if text contains Arabic characters
     """
-    # Arabic Unicode ranges:
-    # U+0600-U+06FF: Arabic
-    # U+0750-U+077F: Arabic Supplement
-    # U+08A0-U+08FF: Arabic Extended-A
-    # U+FB50-U+FDFF: Arabic Presentation Forms-A
-    # U+FE70-U+FEFF: Arabic Presentation Forms-B
-    arabic_pattern = re.compile(
-        r"[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]"
-    )
-    return bool(arabic_pattern.search(text))
+    return _ARABIC_PATTERN.search(text) is not None
 
 
+@lru_cache(maxsize=4096)
 def contains_cjk(text):
     """
     Check if text contains CJK (Chinese, Japanese, Korean) characters.
 
+    Cached, as the same lines are checked again for every font size tried.
+
     :param text: Text to check
     :return: True if text contains CJK characters
     """
-    # CJK Unicode ranges:
-    # U+4E00-U+9FFF: CJK Unified Ideographs (Chinese, Japanese, Korean)
-    # U+3400-U+4DBF: CJK Unified Ideographs Extension A
-    # U+20000-U+2A6DF: CJK Unified Ideographs Extension B
-    # U+2A700-U+2B73F: CJK Unified Ideographs Extension C
-    # U+2B740-U+2B81F: CJK Unified Ideographs Extension D
-    # U+3040-U+309F: Hiragana (Japanese)
-    # U+30A0-U+30FF: Katakana (Japanese)
-    # U+AC00-U+D7AF: Hangul Syllables (Korean)
-    # U+1100-U+11FF: Hangul Jamo (Korean)
-    cjk_pattern = re.compile(
-        r"[\u4E00-\u9FFF\u3400-\u4DBF\u3040-\u309F\u30A0-\u30FF\uAC00-\uD7AF\u1100-\u11FF]"
-    )
-    return bool(cjk_pattern.search(text))
+    return _CJK_PATTERN.search(text) is not None
 
 
 def process_arabic_text(text):
@@ -85,6 +101,9 @@ def process_arabic_text(text):
         return text
 
     try:
+        import arabic_reshaper
+        from bidi.algorithm import get_display
+
         # Reshape Arabic characters (connect letters properly)
         reshaped_text = arabic_reshaper.reshape(text)
         # Apply bidirectional algorithm for RTL display
@@ -111,29 +130,29 @@ def wrap_special_text_with_fonts(text, arabic_font_name=None, cjk_font_name=None
     if not arabic_font_name and not cjk_font_name:
         return text
 
-    # Build a pattern that matches both Arabic and CJK runs
-    patterns = []
-    if arabic_font_name:
-        patterns.append(r"[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]+")
-    if cjk_font_name:
-        patterns.append(r"[\u4E00-\u9FFF\u3400-\u4DBF\u3040-\u309F\u30A0-\u30FF\uAC00-\uD7AF\u1100-\u11FF]+")
-    
-    combined_pattern = "|".join(f"({p})" for p in patterns)
-    parts = re.split(f"({combined_pattern})", text)
-    
+    parts = _SPECIAL_RUN_PATTERNS[(bool(arabic_font_name), bool(cjk_font_name))].split(text)
+
+    # Opening tags are formatted once, the runs are added between the tags
+    arabic_open = f'<font name="{arabic_font_name}">'
+    cjk_open = f'<font name="{cjk_font_name}">'
     out_parts = []
-    for part in parts:
+    for i, part in enumerate(parts):
         if not part:
             continue
-        
-        if arabic_font_name and contains_arabic(part):
-            # Wrap Arabic text with Arabic font tags
-            out_parts.append(f'<font name="{arabic_font_name}">{part}</font>')
-        elif cjk_font_name and contains_cjk(part):
-            # Wrap CJK text with CJK font tags
-            out_parts.append(f'<font name="{cjk_font_name}">{part}</font>')
-        else:
+
+        if i % 2 == 0:
+            # Text between the runs
             out_parts.append(part)
+        elif arabic_font_name and (
+            0x0600 <= ord(part[0]) <= 0x08FF or ord(part[0]) >= 0xFB50
+        ):
+            # Wrap Arabic text with Arabic font tags. A run is all Arabic or all
+            # CJK, and the Arabic ranges do not overlap the CJK ones, so the
+            # first character tells which
+            out_parts.extend((arabic_open, part, "</font>"))
+        else:
+            # Wrap CJK text with CJK font tags
+            out_parts.extend((cjk_open, part, "</font>"))
 
     return "".join(out_parts)
 
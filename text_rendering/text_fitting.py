@@ -4,12 +4,19 @@ Handles optimal font size calculation, text wrapping, and truncation.
 """
 
 import logging
+import math
+from functools import lru_cache
 from reportlab.pdfbase import pdfmetrics
 from reportlab.platypus import Paragraph, Frame
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT
 from reportlab.lib.units import mm
-from .text_processing import prepare_text_with_language_fonts
+from .text_processing import (
+    fill_text_template,
+    prepare_text_template,
+    prepare_text_with_language_fonts,
+)
+from .emoji_handler import find_emojis
 from .language_support import contains_arabic, contains_cjk, get_font_for_text
 
 _LOGGER = logging.getLogger(__name__)
@@ -19,6 +26,26 @@ MIN_FONT_SIZE = 5
 DEFAULT_FONT_SIZE = 12
 EARLY_CHECK_THRESHOLD = 1.5  # Skip optimization if estimated height > threshold * available height
 
+# In-memory caches of font size search results, so identical messages in a batch
+# (e.g. the same greeting sent to many recipients) are only measured once.
+# Paragraph results store the prepared markup and its parsed fragments, not the
+# Paragraph object itself, so a cache hit skips the markup parsing as well.
+_FONT_SIZE_CACHE_MAXSIZE = 256
+_PARAGRAPH_FONT_SIZE_CACHE = {}
+_TEXT_FONT_SIZE_CACHE = {}
+
+# In-memory cache of font heights (ascent - descent, in 1/1000 of the font size)
+# by font name. Only fonts found in the registry are cached, so a font that is
+# registered later is still picked up.
+_FONT_HEIGHT_CACHE = {}
+
+
+def _store_in_cache(cache, key, value):
+    """Store a value in a bounded cache, evicting the oldest entry when full."""
+    if len(cache) >= _FONT_SIZE_CACHE_MAXSIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
 
 def get_font_line_height(font_name, font_size):
     """
@@ -28,18 +55,33 @@ def get_font_line_height(font_name, font_size):
     :param font_size: Size of the font in points
     :return: Line height in points
     """
-    try:
-        font_info = pdfmetrics.getFont(font_name)
-        font_ascent = font_info.face.ascent
-        font_descent = font_info.face.descent
+    actual_font_height = _FONT_HEIGHT_CACHE.get(font_name)
+    if actual_font_height is None:
+        try:
+            font_info = pdfmetrics.getFont(font_name)
+            font_ascent = font_info.face.ascent
+            font_descent = font_info.face.descent
+            actual_font_height = font_ascent - font_descent  # descent is negative
+        except:
+            # Fallback to simple calculation if font metrics not available
+            return font_size * 1.2  # 120% of font size is a common line height
+        _FONT_HEIGHT_CACHE[font_name] = actual_font_height
+
+    # Calculate line height based on actual font metrics with small padding
+    line_height = actual_font_height * font_size / 1000 + 2  # Add 2pt padding
+    return line_height
+
+
+@lru_cache(maxsize=8192)
+def _text_units(font_name, text):
+    """
+    Internal helper: Width of a text in font units (measured at size 1000).
 
-        # Calculate line height based on actual font metrics with small padding
-        actual_font_height = font_ascent - font_descent  # descent is negative
-        line_height = actual_font_height * font_size / 1000 + 2  # Add 2pt padding
-        return line_height
-    except:
-        # Fallback to simple calculation if font metrics not available
-        return font_size * 1.2  # 120% of font size is a common line height
+    Font widths scale linearly with the font size, so the width at any size is
+    0.001 * font_size times this. Cached, as the same words are measured again
+    for every font size tried and for every message of a batch.
+    """
+    return pdfmetrics.getFont(font_name).stringWidth(text, 1000)
 
 
 def wrap_text_to_width(text, max_width, canvas_obj, font_name, font_size):
@@ -48,7 +90,8 @@ def wrap_text_to_width(text, max_width, canvas_obj, font_name, font_size):
 
     :param text: Text to wrap
     :param max_width: Maximum width in points
-    :param canvas_obj: ReportLab canvas object for text measurement
+    :param canvas_obj: ReportLab canvas object (not needed for measuring, the
+        widths come from the font's metrics)
     :param font_name: Font name
     :param font_size: Font size
     :return: List of wrapped lines
@@ -59,64 +102,94 @@ def wrap_text_to_width(text, max_width, canvas_obj, font_name, font_size):
 
     lines = []
     current_line = []
+    current_width = 0
+
+    # Track the line width as the sum of its words and spaces, instead of
+    # measuring the whole line again per word. Widths are cached in font units
+    # across calls and scaled to the font size, so the font size search
+    # measures every word only once
+    scale = 0.001 * font_size
+    space_width = scale * _text_units(font_name, " ")
+
+    def word_width(word):
+        """Width of a word at the font size."""
+        return scale * _text_units(font_name, word)
+
+    def char_units(char):
+        """Width of a character in font units."""
+        return _text_units(font_name, char)
 
     def break_long_word(word, max_width):
         """Break a long word into parts that fit the width."""
-        if canvas_obj.stringWidth(word, font_name, font_size) <= max_width:
+        if word_width(word) <= max_width:
             return [word]
 
         broken_parts = []
-        current_part = ""
+        # The current part is word[part_start:i], sliced out once it is full.
+        # Character widths are summed in font units (measured at size 1000),
+        # which adds up exactly, so every position is checked without
+        # measuring the growing part again
+        part_start = 0
+        current_part_units = 0
+        hyphen_units = char_units("-")
+        last_index = len(word) - 1
 
         for i, char in enumerate(word):
-            test_part = current_part + char
+            units = char_units(char)
+            test_part_units = current_part_units + units
 
             # Check if we need to add a hyphen (except for the last character)
-            is_last_char = i == len(word) - 1
+            is_last_char = i == last_index
             if not is_last_char:
-                test_width = canvas_obj.stringWidth(
-                    test_part + "-", font_name, font_size
-                )
+                test_width = scale * (test_part_units + hyphen_units)
             else:
-                test_width = canvas_obj.stringWidth(test_part, font_name, font_size)
+                test_width = scale * test_part_units
 
             if test_width <= max_width:
-                current_part = test_part
-            else:
+                current_part_units = test_part_units
+            elif i > part_start:
                 # Current part is full, finalize it
-                if current_part:
-                    # Add hyphen if this isn't the last part and part has more than 1 character
-                    if not is_last_char and len(current_part) > 1:
-                        broken_parts.append(current_part + "-")
-                    else:
-                        broken_parts.append(current_part)
-                    current_part = char
+                # Add hyphen if this isn't the last part and part has more than 1 character
+                if not is_last_char and i - part_start > 1:
+                    broken_parts.append(word[part_start:i] + "-")
                 else:
-                    # Single character exceeds width - force it anyway
-                    broken_parts.append(char)
-                    current_part = ""
+                    broken_parts.append(word[part_start:i])
+                part_start = i
+                current_part_units = units
+            else:
+                # Single character exceeds width - force it anyway
+                broken_parts.append(char)
+                part_start = i + 1
+                current_part_units = 0
 
         # Add the final part
-        if current_part:
-            broken_parts.append(current_part)
+        if part_start <= last_index:
+            broken_parts.append(word[part_start:])
 
         return broken_parts
 
-    for word in words:
+    # All word widths in one pass, the loop below then only adds them up
+    widths = [scale * _text_units(font_name, word) for word in words]
+
+    for word, width in zip(words, widths):
         # Test if adding this word would exceed the width
-        test_line = " ".join(current_line + [word])
-        test_width = canvas_obj.stringWidth(test_line, font_name, font_size)
+        if current_line:
+            test_width = current_width + space_width + width
+        else:
+            test_width = width
 
         if test_width <= max_width:
             current_line.append(word)
+            current_width = test_width
         else:
             # If current line has words, finalize it
             if current_line:
                 lines.append(" ".join(current_line))
                 current_line = []
+                current_width = 0
 
             # Check if the word itself is too long
-            if canvas_obj.stringWidth(word, font_name, font_size) > max_width:
+            if width > max_width:
                 # Break the long word
                 broken_parts = break_long_word(word, max_width)
 
@@ -127,8 +200,10 @@ def wrap_text_to_width(text, max_width, canvas_obj, font_name, font_size):
                 # The last part becomes the start of the next line
                 if broken_parts:
                     current_line = [broken_parts[-1]]
+                    current_width = word_width(broken_parts[-1])
             else:
                 current_line = [word]
+                current_width = width
 
     # Add the last line if it has content
     if current_line:
@@ -137,6 +212,98 @@ def wrap_text_to_width(text, max_width, canvas_obj, font_name, font_size):
     return lines
 
 
+def _estimate_text_height(message, max_width, font_name, font_size):
+    """
+    Rough estimate of the wrapped height of a message, assuming an average
+    character width of half the font size.
+
+    :return: (estimated_lines, estimated_height)
+    """
+    estimated_chars_per_line = int(max_width / (font_size * 0.5))
+    estimated_line_height = get_font_line_height(font_name, font_size)
+    estimated_lines = max(
+        len(message) / max(estimated_chars_per_line, 1), len(message.splitlines())
+    )
+    return estimated_lines, estimated_lines * estimated_line_height
+
+
+def _estimate_font_size(
+    message, max_width, available_height, font_name, min_font_size, max_font_size
+):
+    """
+    Largest font size whose estimated height fits, used as the starting point
+    of the font size search.
+    """
+    for font_size in range(max_font_size, min_font_size, -1):
+        _, estimated_height = _estimate_text_height(
+            message, max_width, font_name, font_size
+        )
+        if estimated_height <= available_height:
+            return font_size
+    return min_font_size
+
+
+def _search_largest_fit(measure, guess, minimum, maximum):
+    """
+    Find the largest value that fits (a font size or a line count), starting
+    at an estimated value.
+
+    The estimate and its neighbour are measured first, which settles the search
+    when the estimate is off by at most one. Otherwise it continues as a
+    binary search in the remaining range.
+
+    :param measure: Function measure(value) returning (fits, result)
+    :param guess: Estimated value to measure first
+    :param minimum: Minimum value to try
+    :param maximum: Maximum value to try
+    :return: (best_value, result), or (None, None) if no value fits
+    """
+    best_value = None
+    best_result = None
+    search_min = minimum
+    search_max = maximum
+    test_value = min(max(guess, search_min), search_max)
+    first_probe = True
+
+    while search_min <= search_max:
+        fits, result = measure(test_value)
+        if fits:
+            best_value = test_value
+            best_result = result
+            search_min = test_value + 1
+        else:
+            search_max = test_value - 1
+
+        if first_probe:
+            # Check the neighbour in the direction the estimate was off
+            test_value = search_min if fits else search_max
+            first_probe = False
+        else:
+            test_value = (search_min + search_max) // 2
+
+    return best_value, best_result
+
+
+def _estimate_wrap_count(line_units, max_width, font_size):
+    """
+    Lower bound of the number of lines wrap_text_to_width produces for a message.
+
+    Every wrapped line is at most max_width wide and holds the words of its input
+    line without the spaces between them, so an input line needs at least its
+    width without spaces divided by max_width lines (and at least one).
+
+    :param line_units: Width of every input line without spaces, in font units
+        (measured at size 1000), 0 for blank lines
+    :param max_width: Maximum width in points
+    :param font_size: Font size
+    :return: Minimum number of wrapped lines
+    """
+    scale = 0.001 * font_size / max_width
+    # The small tolerance keeps rounding errors from adding a line when a line
+    # fills the width exactly
+    return sum(max(1, math.ceil(units * scale - 1e-9)) for units in line_units)
+
+
 def estimate_if_text_fits(message, max_width, available_height, font_name):
     """
     Quickly estimate if message can possibly fit at minimum font size.
@@ -147,12 +314,9 @@ def estimate_if_text_fits(message, max_width, available_height, font_name):
     :param font_name: Font name for metrics
     :return: None (needs full check), True (likely fits), or False (definitely won't fit)
     """
-    estimated_chars_per_line = int(max_width / (MIN_FONT_SIZE * 0.5))
-    estimated_line_height = get_font_line_height(font_name, MIN_FONT_SIZE)
-    estimated_lines = max(
-        len(message) / max(estimated_chars_per_line, 1), len(message.splitlines())
+    estimated_lines, estimated_min_height = _estimate_text_height(
+        message, max_width, font_name, MIN_FONT_SIZE
     )
-    estimated_min_height = estimated_lines * estimated_line_height
 
     if estimated_min_height > available_height * EARLY_CHECK_THRESHOLD:
         _LOGGER.warning(
@@ -163,6 +327,40 @@ def estimate_if_text_fits(message, max_width, available_height, font_name):
     return None
 
 
+def _emoji_safety_margin(message, enable_emoji):
+    """
+    Calculate dynamic safety margin based on emoji density, subtracted from the
+    available height of Paragraph rendering.
+    More emojis = larger safety margin needed due to ReportLab rendering quirks.
+
+    :param message: Text message
+    :param enable_emoji: Enable emoji support
+    :return: Safety margin in points
+    """
+    if not enable_emoji:
+        return 0
+
+    message_lines = message.splitlines()
+    emoji_count = len(find_emojis(message))
+    emoji_density = emoji_count / max(len(message_lines), 1)
+
+    # Base safety margin for emoji support
+    safety_margin = 20
+
+    # Additional margin for high emoji density (e.g., emoji-only lines)
+    if emoji_density > 2:  # More than 2 emojis per line on average
+        safety_margin += 15
+        _LOGGER.debug(f"High emoji density detected ({emoji_density:.1f} emojis/line): increasing safety margin to {safety_margin}pt")
+
+    # Additional margin for many blank lines - INCREASED from 10pt to 20pt
+    blank_lines = sum(1 for line in message_lines if not line.strip())
+    if blank_lines > 2:
+        safety_margin += (blank_lines * 2)  # 2pt per blank line
+        _LOGGER.debug(f"Many blank lines detected ({blank_lines}): increasing safety margin by {blank_lines * 2}pt to total {safety_margin}pt")
+
+    return safety_margin
+
+
 def find_optimal_font_size_for_paragraph(
     message,
     max_width,
@@ -187,30 +385,31 @@ def find_optimal_font_size_for_paragraph(
     :param enable_emoji: Enable emoji support
     :return: (best_font_size, text_fits_completely, final_paragraph)
     """
-    import emoji as emoji_lib
-    
-    # Calculate dynamic safety margin based on emoji density
-    # More emojis = larger safety margin needed due to ReportLab rendering quirks
-    safety_margin = 0
-    if enable_emoji:
-        emoji_count = len(emoji_lib.emoji_list(message))
-        line_count = len(message.splitlines())
-        emoji_density = emoji_count / max(line_count, 1)
-        
-        # Base safety margin for emoji support
-        safety_margin = 20
-        
-        # Additional margin for high emoji density (e.g., emoji-only lines)
-        if emoji_density > 2:  # More than 2 emojis per line on average
-            safety_margin += 15
-            _LOGGER.debug(f"High emoji density detected ({emoji_density:.1f} emojis/line): increasing safety margin to {safety_margin}pt")
-        
-        # Additional margin for many blank lines - INCREASED from 10pt to 20pt
-        blank_lines = sum(1 for line in message.splitlines() if not line.strip())
-        if blank_lines > 2:
-            safety_margin += (blank_lines * 2)  # 2pt per blank line
-            _LOGGER.debug(f"Many blank lines detected ({blank_lines}): increasing safety margin by {blank_lines * 2}pt to total {safety_margin}pt")
+    cache_key = (
+        message, round(max_width, 1), round(available_height, 1), font_name,
+        min_font_size, max_font_size, alignment, enable_emoji, text_color,
+    )
+    cached = _PARAGRAPH_FONT_SIZE_CACHE.get(cache_key)
+    if cached is not None:
+        best_fitting_size, text_fits, para_source, leading, para_frags = cached
+        final_para = None
+        if para_source is not None:
+            style = ParagraphStyle(
+                "MessageStyle",
+                fontName=font_name,
+                fontSize=best_fitting_size,
+                leading=leading,
+                alignment=alignment,
+                leftIndent=0,
+                rightIndent=0,
+                spaceBefore=0,
+                spaceAfter=0,
+            )
+            final_para = Paragraph(para_source, style, frags=para_frags)
+        _LOGGER.debug(f"Font size cache hit: {best_fitting_size}pt with text_fits={text_fits}")
+        return best_fitting_size, text_fits, final_para
     
+    safety_margin = _emoji_safety_margin(message, enable_emoji)
     adjusted_available_height = max(available_height - safety_margin, available_height * 0.80)
     
     _LOGGER.info(f"Font size optimization: available_height={available_height/mm:.1f}mm, "
@@ -228,35 +427,57 @@ def find_optimal_font_size_for_paragraph(
         spaceAfter=0,
     )
 
-    best_fitting_size = min_font_size
-    text_fits = False
-    search_min = min_font_size
-    search_max = max_font_size
-    final_para = None
+    # Emojis, scripts and markup are processed once, only the emoji size
+    # changes between font sizes
+    message_template = prepare_text_template(message, enable_emoji, text_color)
 
-    while search_min <= search_max:
-        test_font_size = (search_min + search_max) // 2
+    def measure(test_font_size):
         style.fontSize = test_font_size
         style.leading = get_font_line_height(font_name, test_font_size)
 
-        processed_message = prepare_text_with_language_fonts(
-            message, enable_emoji, test_font_size, text_color
-        )
+        processed_message = fill_text_template(message_template, test_font_size)
 
         para = Paragraph(processed_message, style)
         w, h = para.wrap(max_width, adjusted_available_height)
 
         if h <= adjusted_available_height:
-            best_fitting_size = test_font_size
-            text_fits = True
-            final_para = para
-            search_min = test_font_size + 1
             _LOGGER.debug(f"  Font size {test_font_size}pt: height={h/mm:.1f}mm - FITS")
-        else:
-            search_max = test_font_size - 1
-            _LOGGER.debug(f"  Font size {test_font_size}pt: height={h/mm:.1f}mm - TOO LARGE")
+            return True, para
+        _LOGGER.debug(f"  Font size {test_font_size}pt: height={h/mm:.1f}mm - TOO LARGE")
+        return False, None
+
+    # Start the search at an estimated size, so that usually only two sizes
+    # have to be wrapped
+    guess = _estimate_font_size(
+        message, max_width, adjusted_available_height, font_name,
+        min_font_size, max_font_size,
+    )
+    best_fitting_size, final_para = _search_largest_fit(
+        measure, guess, min_font_size, max_font_size
+    )
+    text_fits = final_para is not None
+    leading = None
+    if best_fitting_size is None:
+        best_fitting_size = min_font_size
+    else:
+        # The paragraph shares the style, which holds the last size measured
+        # (possibly a larger one that did not fit), reset it to the chosen size
+        leading = get_font_line_height(font_name, best_fitting_size)
+        style.fontSize = best_fitting_size
+        style.leading = leading
 
     _LOGGER.info(f"Best fitting font size: {best_fitting_size}pt with text_fits={text_fits}")
+    _store_in_cache(
+        _PARAGRAPH_FONT_SIZE_CACHE,
+        cache_key,
+        (
+            best_fitting_size,
+            text_fits,
+            final_para.text if final_para is not None else None,
+            leading,
+            final_para.frags if final_para is not None else None,
+        ),
+    )
     return best_fitting_size, text_fits, final_para
 
 
@@ -282,6 +503,16 @@ def find_optimal_font_size_for_text(
     :param max_font_size: Maximum font size to try
     :return: (best_font_size, wrapped_lines)
     """
+    cache_key = (
+        message, round(max_width, 1), round(available_height, 1), font_name,
+        min_font_size, max_font_size,
+    )
+    cached = _TEXT_FONT_SIZE_CACHE.get(cache_key)
+    if cached is not None:
+        best_fitting_size, wrapped_lines = cached
+        _LOGGER.debug(f"Font size cache hit: {best_fitting_size}pt with {len(wrapped_lines)} lines")
+        return best_fitting_size, list(wrapped_lines)
+
     def wrap_message_at_size(text, size):
         """Helper to wrap entire message at a specific font size."""
         canvas_obj.setFont(font_name, size)
@@ -294,29 +525,46 @@ def find_optimal_font_size_for_text(
                 wrapped.append("")
         return wrapped
 
-    # Start with minimum font size as baseline
-    best_wrapped_lines = wrap_message_at_size(message, min_font_size)
-    best_fitting_size = min_font_size
-    search_min = min_font_size
-    search_max = max_font_size
+    # Width of every line without spaces, summed from the cached word widths
+    # that wrapping uses as well. It gives a lower bound of the wrapped line
+    # count at any size, so sizes that cannot fit are rejected without
+    # wrapping the message.
+    line_units = []
+    for line in message.splitlines():
+        line_font = get_font_for_text(line, font_name)
+        line_units.append(sum(_text_units(line_font, word) for word in line.split()))
 
-    # Binary search for optimal size
-    while search_min <= search_max:
-        test_font_size = (search_min + search_max) // 2
-        test_wrapped_lines = wrap_message_at_size(message, test_font_size)
+    def measure(test_font_size):
         line_height = get_font_line_height(font_name, test_font_size)
+        min_line_count = _estimate_wrap_count(line_units, max_width, test_font_size)
+        if min_line_count * line_height > available_height:
+            _LOGGER.debug(f"  Font size {test_font_size}pt: at least {min_line_count} lines - TOO LARGE")
+            return False, None
+
+        test_wrapped_lines = wrap_message_at_size(message, test_font_size)
         total_text_height = len(test_wrapped_lines) * line_height
 
         if total_text_height <= available_height:
-            best_fitting_size = test_font_size
-            best_wrapped_lines = test_wrapped_lines
-            search_min = test_font_size + 1
             _LOGGER.debug(f"  Font size {test_font_size}pt: {len(test_wrapped_lines)} lines, height={total_text_height/mm:.1f}mm - FITS")
-        else:
-            search_max = test_font_size - 1
-            _LOGGER.debug(f"  Font size {test_font_size}pt: {len(test_wrapped_lines)} lines, height={total_text_height/mm:.1f}mm - TOO LARGE")
+            return True, test_wrapped_lines
+        _LOGGER.debug(f"  Font size {test_font_size}pt: {len(test_wrapped_lines)} lines, height={total_text_height/mm:.1f}mm - TOO LARGE")
+        return False, None
+
+    # Start the search at an estimated size, so that usually only two sizes
+    # have to be wrapped
+    guess = _estimate_font_size(
+        message, max_width, available_height, font_name, min_font_size, max_font_size
+    )
+    best_fitting_size, best_wrapped_lines = _search_largest_fit(
+        measure, guess, min_font_size, max_font_size
+    )
+    if best_fitting_size is None:
+        # Nothing fits, fall back to the minimum font size
+        best_fitting_size = min_font_size
+        best_wrapped_lines = wrap_message_at_size(message, min_font_size)
 
     _LOGGER.info(f"Best fitting font size: {best_fitting_size}pt with {len(best_wrapped_lines)} lines")
+    _store_in_cache(_TEXT_FONT_SIZE_CACHE, cache_key, (best_fitting_size, tuple(best_wrapped_lines)))
     return best_fitting_size, best_wrapped_lines
 
 
@@ -335,23 +583,9 @@ def truncate_paragraph_to_fit(
     :param enable_emoji: Enable emoji support
     :return: (truncated_paragraph, lines_used, total_lines)
     """
-    import emoji as emoji_lib
-    
     # Calculate safety margin for truncation (same as optimization)
-    safety_margin = 0
-    if enable_emoji:
-        emoji_count = len(emoji_lib.emoji_list(message))
-        line_count = len(message.splitlines())
-        emoji_density = emoji_count / max(line_count, 1)
-        
-        safety_margin = 20
-        if emoji_density > 2:
-            safety_margin += 15
-        
-        blank_lines = sum(1 for line in message.splitlines() if not line.strip())
-        if blank_lines > 2:
-            safety_margin += (blank_lines * 2)  # 2pt per blank line
-    
+    safety_margin = _emoji_safety_margin(message, enable_emoji)
+
     # Use adjusted height for truncation (consistent with optimization)
     adjusted_available_height = max(available_height - safety_margin, available_height * 0.80)
     
@@ -369,13 +603,8 @@ def truncate_paragraph_to_fit(
     else:
         style.leading = default_leading
 
-    max_lines = len(message_lines)
-    min_lines = 1
-    best_fit_lines = 1
-
-    while min_lines <= max_lines:
-        mid_lines = (min_lines + max_lines) // 2
-        truncated_message = "\n".join(message_lines[:mid_lines])
+    def measure(line_count):
+        truncated_message = "\n".join(message_lines[:line_count])
 
         processed_message = prepare_text_with_language_fonts(
             truncated_message, enable_emoji, font_size, text_color
@@ -385,12 +614,35 @@ def truncate_paragraph_to_fit(
         w, h = para.wrap(max_width, adjusted_available_height)
 
         if h <= adjusted_available_height:
-            best_fit_lines = mid_lines
-            min_lines = mid_lines + 1
-            _LOGGER.debug(f"  Truncate to {mid_lines} lines: height={h/mm:.1f}mm - FITS")
-        else:
-            max_lines = mid_lines - 1
-            _LOGGER.debug(f"  Truncate to {mid_lines} lines: height={h/mm:.1f}mm - TOO LARGE")
+            _LOGGER.debug(f"  Truncate to {line_count} lines: height={h/mm:.1f}mm - FITS")
+            return True, None
+        _LOGGER.debug(f"  Truncate to {line_count} lines: height={h/mm:.1f}mm - TOO LARGE")
+        return False, None
+
+    # Every non-blank message line takes at least one paragraph line (blank
+    # lines may take none), so the search stops before the non-blank line that
+    # would exceed the paragraph lines fitting the height. It starts at the
+    # number of lines whose predicted wrapped height fits, predicted from the
+    # measured width of each line.
+    max_paragraph_lines = max(1, int(adjusted_available_height / style.leading))
+    string_width = pdfmetrics.getFont(font_name).stringWidth
+    max_lines = len(message_lines)
+    guess = 0
+    non_blank_lines = 0
+    estimated_lines = 0
+    for i, line in enumerate(message_lines):
+        if line.strip():
+            non_blank_lines += 1
+            if non_blank_lines > max_paragraph_lines:
+                max_lines = i
+                break
+        estimated_lines += max(1, math.ceil(string_width(line, font_size) / max_width))
+        if estimated_lines * style.leading <= adjusted_available_height:
+            guess = i + 1
+
+    best_fit_lines, _ = _search_largest_fit(measure, guess, 1, max_lines)
+    if best_fit_lines is None:
+        best_fit_lines = 1
 
     # Create final truncated paragraph
     if best_fit_lines < len(message_lines):
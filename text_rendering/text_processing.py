@@ -4,13 +4,28 @@ Handles color conversion, HTML escaping, and text rendering preparation.
 """
 
 import re
-import emoji
 import logging
-from .emoji_handler import replace_emojis_with_images
-from .language_support import contains_arabic, process_arabic_text, wrap_special_text_with_fonts, get_arabic_font, get_cjk_font
+from functools import lru_cache
+from .emoji_handler import fill_emoji_size, find_emojis, replace_emojis_with_images
+from .language_support import contains_arabic, contains_cjk, process_arabic_text, wrap_special_text_with_fonts, get_arabic_font, get_cjk_font
 
 _LOGGER = logging.getLogger(__name__)
 
+# In-memory cache of has_special_rendering_needs results, so the texts repeated
+# across a batch are only scanned for emojis and scripts once
+_SPECIAL_RENDERING_NEEDS_CACHE = {}
+_SPECIAL_RENDERING_NEEDS_CACHE_MAXSIZE = 1024
+
+# Markup kept by escape_html_except_tags, <img> tags are also kept as they are by
+# the Arabic and font processing. Each pattern is a single group, so re.split
+# returns the tags at the odd indices
+_IMG_TAG_PATTERN = re.compile(r"(<img[^>]+>)")
+_FONT_TAG_PATTERN = re.compile(r"(<font[^>]+>|</font>)")
+
+# Color formats accepted by get_color_rgb besides names
+_HEX_COLOR_PATTERN = re.compile(r"[0-9a-f]{6}")
+_RGB_COLOR_PATTERN = re.compile(r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)')
+
 # Color mapping from color names to RGB tuples
 COLOR_MAP = {
     "black": (0, 0, 0),
@@ -40,7 +55,16 @@ def get_color_rgb(color_input):
     """
     if not color_input or not isinstance(color_input, str):
         return (0, 0, 0)  # Default to black
-    
+    return _parse_color(color_input)
+
+
+@lru_cache(maxsize=64)
+def _parse_color(color_input):
+    """
+    Internal helper: Parse a color string for get_color_rgb.
+
+    Cached, as every message of a batch is usually rendered in the same color.
+    """
     color_input = color_input.strip().lower()
     
     # Check if it's a predefined color name
@@ -50,7 +74,7 @@ def get_color_rgb(color_input):
     # Check for hex color code
     if color_input.startswith('#'):
         hex_color = color_input.lstrip('#')
-    elif len(color_input) == 6 and all(c in '0123456789abcdef' for c in color_input):
+    elif _HEX_COLOR_PATTERN.fullmatch(color_input):
         hex_color = color_input
     else:
         hex_color = None
@@ -65,7 +89,7 @@ def get_color_rgb(color_input):
             pass
     
     # Check for RGB format: "255,0,0" or "rgb(255,0,0)"
-    rgb_match = re.match(r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', color_input)
+    rgb_match = _RGB_COLOR_PATTERN.match(color_input)
     if rgb_match:
         try:
             r = int(rgb_match.group(1)) / 255.0
@@ -97,28 +121,23 @@ def escape_html_except_tags(text):
     :param text: Text that may contain HTML entities, <img> tags, and <font> tags
     :return: Escaped text with allowed tags preserved
     """
-    # First, temporarily replace allowed tags with placeholders
-    allowed_tags = []
-
-    def save_tag(match):
-        allowed_tags.append(match.group(0))
-        return f"___TAG_{len(allowed_tags)-1}___"
-
-    # Save <img> tags and <font> tags (both opening and closing)
-    text = re.sub(r"<img[^>]+>", save_tag, text)
-    text = re.sub(r"<font[^>]+>", save_tag, text)
-    text = re.sub(r"</font>", save_tag, text)
-
-    # Escape HTML entities
-    text = text.replace("&", "&amp;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
-
-    # Restore allowed tags
-    for i, tag in enumerate(allowed_tags):
-        text = text.replace(f"___TAG_{i}___", tag)
+    # Split the text at the allowed tags and escape only the text between them,
+    # <img> tags first, so a <font> tag cannot reach into one
+    escaped_parts = []
+    for i, part in enumerate(_IMG_TAG_PATTERN.split(text)):
+        if i % 2:
+            escaped_parts.append(part)
+            continue
+        for j, sub_part in enumerate(_FONT_TAG_PATTERN.split(part)):
+            if j % 2:
+                escaped_parts.append(sub_part)
+            else:
+                # Escape HTML entities
+                escaped_parts.append(
+                    sub_part.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+                )
 
-    return text
+    return "".join(escaped_parts)
 
 
 def process_text_for_rendering(text, font_size, enable_emoji=True):
@@ -130,7 +149,7 @@ def process_text_for_rendering(text, font_size, enable_emoji=True):
     2. Process Arabic text for proper RTL display
 
     :param text: Text to process
-    :param font_size: Font size for emoji sizing
+    :param font_size: Font size for emoji sizing, or None to leave a placeholder
     :param enable_emoji: Enable emoji replacement
     :return: Processed text ready for rendering
     """
@@ -142,7 +161,7 @@ def process_text_for_rendering(text, font_size, enable_emoji=True):
     # Note: HTML tags from emoji replacement are preserved
     if contains_arabic(text):
         # Split by HTML tags to preserve them
-        parts = re.split(r"(<img[^>]+>)", text)
+        parts = _IMG_TAG_PATTERN.split(text)
         processed_parts = []
 
         for part in parts:
@@ -158,51 +177,91 @@ def process_text_for_rendering(text, font_size, enable_emoji=True):
     return text
 
 
+@lru_cache(maxsize=64)
+def _color_to_hex(text_color):
+    """Internal helper: Convert text color to hex format for HTML font tag."""
+    rgb = get_color_rgb(text_color)
+    return "#{:02x}{:02x}{:02x}".format(
+        int(rgb[0] * 255),
+        int(rgb[1] * 255),
+        int(rgb[2] * 255)
+    )
+
+
 def prepare_text_with_language_fonts(text, enable_emoji=True, font_size=12, text_color="black"):
     """
     Prepare text for ReportLab Paragraph rendering with proper font tags and emoji support.
     
     :param text: Raw text to prepare
     :param enable_emoji: Whether to replace emojis with images
-    :param font_size: Font size for emoji sizing
+    :param font_size: Font size for emoji sizing, or None to leave a placeholder
+        (see prepare_text_template)
     :param text_color: Text color name or hex code (default='black')
     :return: HTML-formatted text ready for Paragraph rendering
     """
-    # Process for emoji and Arabic RTL
-    processed_text = process_text_for_rendering(text, font_size, enable_emoji)
-    
-    # Preserve <img> tags while wrapping Arabic/CJK text spans with appropriate fonts
-    arabic_font_name = get_arabic_font()
-    cjk_font_name = get_cjk_font()
-    parts = re.split(r"(<img[^>]+>)", processed_text)
-    wrapped_parts = []
-    for p in parts:
-        if p.startswith("<img"):
-            wrapped_parts.append(p)
-        else:
-            # wrap Arabic and CJK spans inside this text part
-            wrapped = wrap_special_text_with_fonts(p, arabic_font_name, cjk_font_name)
-            wrapped_parts.append(wrapped)
-    processed_text = "".join(wrapped_parts)
+    if text.isascii():
+        # Plain ASCII text has no emojis, Arabic or CJK, so only escaping and
+        # line breaks apply
+        processed_text = text
+    else:
+        # Process for emoji and Arabic RTL
+        processed_text = process_text_for_rendering(text, font_size, enable_emoji)
+
+        # Only scripts that occur in the text need a font. Without Arabic and
+        # CJK (e.g. accented Latin text or emojis) there is nothing to wrap
+        arabic_font_name = get_arabic_font() if contains_arabic(text) else None
+        cjk_font_name = get_cjk_font() if contains_cjk(text) else None
+        if arabic_font_name or cjk_font_name:
+            # Preserve <img> tags while wrapping Arabic/CJK text spans with appropriate fonts
+            parts = _IMG_TAG_PATTERN.split(processed_text)
+            wrapped_parts = []
+            for p in parts:
+                if p.startswith("<img"):
+                    wrapped_parts.append(p)
+                else:
+                    # wrap Arabic and CJK spans inside this text part
+                    wrapped = wrap_special_text_with_fonts(p, arabic_font_name, cjk_font_name)
+                    wrapped_parts.append(wrapped)
+            processed_text = "".join(wrapped_parts)
     
     # Escape HTML and convert newlines
     processed_text = escape_html_except_tags(processed_text)
     processed_text = processed_text.replace("\n", "<br/>")
     
-    # Convert text color to hex format for HTML font tag
-    rgb = get_color_rgb(text_color)
-    hex_color = "#{:02x}{:02x}{:02x}".format(
-        int(rgb[0] * 255),
-        int(rgb[1] * 255),
-        int(rgb[2] * 255)
-    )
-    
     # Wrap entire text in a font tag with the specified color
-    processed_text = f'<font color="{hex_color}">{processed_text}</font>'
+    processed_text = f'<font color="{_color_to_hex(text_color)}">{processed_text}</font>'
     
     return processed_text
 
 
+def prepare_text_template(text, enable_emoji=True, text_color="black"):
+    """
+    Prepare text once for rendering at several font sizes.
+
+    Only the emoji image size depends on the font size, so emoji lookup,
+    RTL processing, font wrapping and escaping are done once here, and
+    fill_text_template fills in the size for each font size.
+
+    :param text: Raw text to prepare
+    :param enable_emoji: Whether to replace emojis with images
+    :param text_color: Text color name or hex code (default='black')
+    :return: HTML-formatted text with a placeholder for the emoji size
+    """
+    return prepare_text_with_language_fonts(text, enable_emoji, None, text_color)
+
+
+def fill_text_template(template, font_size):
+    """
+    Fill in the emoji size of text prepared by prepare_text_template.
+
+    :param template: Text returned by prepare_text_template
+    :param font_size: Font size for emoji sizing
+    :return: HTML-formatted text ready for Paragraph rendering, the same as
+        prepare_text_with_language_fonts returns for this font size
+    """
+    return fill_emoji_size(template, font_size)
+
+
 def has_special_rendering_needs(text, enable_emoji=True):
     """
     Check if text has special rendering needs (emoji, Arabic, CJK).
@@ -211,10 +270,17 @@ def has_special_rendering_needs(text, enable_emoji=True):
     :param enable_emoji: Whether emoji support is enabled
     :return: True if text needs Paragraph rendering (vs simple canvas text)
     """
-    from .language_support import contains_cjk
-    
-    has_emojis = enable_emoji and bool(emoji.emoji_list(text))
+    cache_key = (text, enable_emoji)
+    if cache_key in _SPECIAL_RENDERING_NEEDS_CACHE:
+        return _SPECIAL_RENDERING_NEEDS_CACHE[cache_key]
+
+    has_emojis = enable_emoji and bool(find_emojis(text))
     has_arabic = contains_arabic(text)
     has_cjk = contains_cjk(text)
-    
-    return has_emojis or has_arabic or has_cjk
+    needs_special_rendering = has_emojis or has_arabic or has_cjk
+
+    if len(_SPECIAL_RENDERING_NEEDS_CACHE) >= _SPECIAL_RENDERING_NEEDS_CACHE_MAXSIZE:
+        # Evict the oldest entry
+        del _SPECIAL_RENDERING_NEEDS_CACHE[next(iter(_SPECIAL_RENDERING_NEEDS_CACHE))]
+    _SPECIAL_RENDERING_NEEDS_CACHE[cache_key] = needs_special_rendering
+    return needs_special_rendering
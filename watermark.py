@@ -79,6 +79,8 @@ def add_watermark(input_pdf, output_pdf, watermark_text, page_number=2):
     writer = PdfWriter()
 
     num_pages = len(reader.pages)
+    # Wasserzeichen-Seite je Seitengröße nur einmal erzeugen
+    watermark_pages = {}
     # Seitenwahl: 0 = keine, -1 = alle, sonst bestimmte Seite (1-basiert)
     for idx, page in enumerate(reader.pages):
         apply = False
@@ -89,11 +91,15 @@ def add_watermark(input_pdf, output_pdf, watermark_text, page_number=2):
         elif idx == (page_number - 1):
             apply = True
         if apply:
-            wmark_pdf = create_watermark_bottom_Left(
-                watermark_text,
-                pagesize=(float(page.mediabox.width), float(page.mediabox.height)),
-            )
-            watermark_page = wmark_pdf.pages[0]
+            pagesize = (float(page.mediabox.width), float(page.mediabox.height))
+            watermark_page = watermark_pages.get(pagesize)
+            if watermark_page is None:
+                wmark_pdf = create_watermark_bottom_Left(
+                    watermark_text,
+                    pagesize=pagesize,
+                )
+                watermark_page = wmark_pdf.pages[0]
+                watermark_pages[pagesize] = watermark_page
             page.merge_page(watermark_page)
         writer.add_page(page)
 